@@ -0,0 +1,178 @@
+import asyncio
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import settings
+from app.core.config.base import per_worker
+from app.core.exceptions import DeadlineExceededException, ServiceOverloadedException
+from app.core.metrics import metrics_registry
+from app.utils.deadline import deadline, remaining_seconds
+
+__all__ = ["ConcurrencyLimiter", "AdmissionControlMiddleware", "classify_request", "limiters"]
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+# Routes that don't hold a database connection for their whole lifetime are not limited
+EXEMPT_PATHS = frozenset({"/api/missions/stream", "/api/metrics", "/api/ready"})
+
+# Requests that touch many rows at once get their own, smaller, limit
+BULK_ROUTES: tuple[tuple[str, re.Pattern[str]], ...] = (("PATCH", re.compile(r"^/api/mission/[^/]+/targets$")),)
+
+
+class Overloaded(Exception):
+    pass
+
+
+class ConcurrencyLimiter:
+    """
+    Allows at most `limit` requests of a route class at a time.
+    Up to `queue_size` requests wait for a slot, each no longer than `max_wait` seconds;
+    anything beyond that is rejected immediately instead of piling up on the database pool.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, max_wait: float) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        if self._semaphore.locked():
+            if self.waiting >= self.queue_size:
+                self.rejected += 1
+                raise Overloaded
+
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_wait)
+            except TimeoutError:
+                self.timed_out += 1
+                raise Overloaded from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_size": self.queue_size,
+            "queue_depth": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+limiters: dict[str, ConcurrencyLimiter] = {
+    "read": ConcurrencyLimiter(
+        "read",
+        limit=per_worker(settings.admission.READ_CONCURRENCY, settings.worker_processes),
+        queue_size=settings.admission.READ_QUEUE_SIZE,
+        max_wait=settings.admission.READ_MAX_WAIT_SECONDS,
+    ),
+    "write": ConcurrencyLimiter(
+        "write",
+        limit=per_worker(settings.admission.WRITE_CONCURRENCY, settings.worker_processes),
+        queue_size=settings.admission.WRITE_QUEUE_SIZE,
+        max_wait=settings.admission.WRITE_MAX_WAIT_SECONDS,
+    ),
+    "bulk": ConcurrencyLimiter(
+        "bulk",
+        limit=per_worker(settings.admission.BULK_CONCURRENCY, settings.worker_processes),
+        queue_size=settings.admission.BULK_QUEUE_SIZE,
+        max_wait=settings.admission.BULK_MAX_WAIT_SECONDS,
+    ),
+}
+
+deadlines: dict[str, float] = {
+    "read": settings.admission.READ_DEADLINE_SECONDS,
+    "write": settings.admission.WRITE_DEADLINE_SECONDS,
+    "bulk": settings.admission.BULK_DEADLINE_SECONDS,
+}
+
+metrics_registry.register("admission", lambda: {name: limiter.stats() for name, limiter in limiters.items()})
+
+
+def classify_request(method: str, path: str) -> str | None:
+    if not path.startswith("/api/") or path in EXEMPT_PATHS or method == "OPTIONS":
+        return None
+
+    for bulk_method, pattern in BULK_ROUTES:
+        if method == bulk_method and pattern.match(path):
+            return "bulk"
+
+    return "read" if method in READ_METHODS else "write"
+
+
+class AdmissionControlMiddleware:
+    """
+    Pure ASGI middleware, so streaming responses are passed through untouched.
+    Besides the concurrency limit, every request gets the deadline of its route class: the request is cancelled
+    when it runs out, and `SQLUnitOfWork` hands what is left of it to Postgres as the statement timeout.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify_request(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        exc: ServiceOverloadedException | DeadlineExceededException
+        with deadline(deadlines[route_class]):
+            timeout = asyncio.timeout(remaining_seconds())
+            try:
+                async with timeout:
+                    async with limiters[route_class].acquire():
+                        await self.app(scope, receive, send_wrapper)
+                return
+            except Overloaded:
+                exc = ServiceOverloadedException(
+                    route_class,
+                    headers={"Retry-After": str(settings.admission.RETRY_AFTER_SECONDS)},
+                )
+            except TimeoutError:
+                if not timeout.expired():
+                    raise
+                if response_started:
+                    return
+                exc = DeadlineExceededException()
+
+        response = JSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+        await response(scope, receive, send)
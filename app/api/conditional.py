@@ -0,0 +1,56 @@
+import hashlib
+import json
+from collections.abc import Iterator
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+from starlette import status
+
+__all__ = [
+    "make_etag",
+    "make_collection_etag",
+    "is_not_modified",
+    "not_modified_response",
+    "NOT_MODIFIED_RESPONSES",
+]
+
+NOT_MODIFIED_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified, the representation matches If-None-Match"},
+}
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the given version parts (ids, updated_at timestamps, representation options)."""
+    payload = json.dumps(parts, default=str, separators=(",", ":"))
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _versions(obj: Any) -> Iterator[Any]:
+    if isinstance(obj, BaseModel):
+        if hasattr(obj, "id") and hasattr(obj, "updated_at"):
+            yield obj.id, obj.updated_at
+        for name in type(obj).model_fields:
+            yield from _versions(getattr(obj, name))
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _versions(item)
+
+
+def make_collection_etag(page: BaseModel, *parts: Any) -> str:
+    """ETag of a list response: versions of every item, nested relations included, plus the page metadata."""
+    return make_etag(*parts, page.model_dump(exclude={"items"}), list(_versions(page)))
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -1,7 +1,8 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import Depends
+from fastapi import Depends, Header
 
+from app.enums.database import DatabasePool
 from app.services.mission import get_mission_service, MissionService
 from app.services.spy_cat import SpyCatsService, get_cat_service
 from app.uow.base import ABCUnitOfWork
@@ -9,12 +10,57 @@ from app.uow.sql import SQLUnitOfWork
 
 __all__ = [
     "SQLUnitOfWorkDep",
+    "BulkSQLUnitOfWorkDep",
     "cat_service",
     "mission_service",
+    "ReturnPreference",
+    "return_preference",
+    "idempotency_key",
 ]
 
+ReturnPreference = Literal["minimal", "representation"]
 
-SQLUnitOfWorkDep = Annotated[ABCUnitOfWork, Depends(SQLUnitOfWork)]
+
+def get_return_preference(
+    prefer: str | None = Header(None, description="RFC 7240 preference, e.g. 'return=minimal'"),
+) -> ReturnPreference | None:
+    """Reads the `return` preference of the `Prefer` header; None when the client didn't state one."""
+    if prefer:
+        for preference in prefer.replace(";", ",").split(","):
+            key, _, value = preference.strip().partition("=")
+            if key.strip().lower() != "return":
+                continue
+            value = value.strip().strip('"').lower()
+            if value == "minimal":
+                return "minimal"
+            if value == "representation":
+                return "representation"
+    return None
+
+
+def get_sql_uow() -> ABCUnitOfWork:
+    return SQLUnitOfWork(pool=DatabasePool.interactive)
+
+
+def get_bulk_sql_uow() -> ABCUnitOfWork:
+    """Unit of work on the bulk pool, so heavy requests can't starve the interactive ones."""
+    return SQLUnitOfWork(pool=DatabasePool.bulk)
+
+
+SQLUnitOfWorkDep = Annotated[ABCUnitOfWork, Depends(get_sql_uow)]
+BulkSQLUnitOfWorkDep = Annotated[ABCUnitOfWork, Depends(get_bulk_sql_uow)]
 
 cat_service = Annotated[SpyCatsService, Depends(get_cat_service)]
 mission_service = Annotated[MissionService, Depends(get_mission_service)]
+
+return_preference = Annotated[ReturnPreference | None, Depends(get_return_preference)]
+
+idempotency_key = Annotated[
+    str | None,
+    Header(
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="Retries with the same key return the result of the first request instead of repeating it",
+    ),
+]
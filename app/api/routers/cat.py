@@ -1,16 +1,22 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Response
 from starlette import status
 
 from app import schemas
 from app.api.dependencies import (
     SQLUnitOfWorkDep,
     cat_service,
+    idempotency_key,
+)
+from app.api.conditional import (
+    NOT_MODIFIED_RESPONSES,
+    is_not_modified,
+    make_collection_etag,
+    make_etag,
+    not_modified_response,
 )
-from app.core.constants.base import PAGINATION_PER_PAGE
-
-from app.schemas import PaginatedResponse
 
 __all__ = ["router"]
 
@@ -20,19 +26,37 @@ router = APIRouter(prefix="/cat", tags=["Spy Cats"])
 @router.get(
     "s",
     status_code=status.HTTP_200_OK,
-    response_model=PaginatedResponse[schemas.Cat],
+    response_model=schemas.PaginatedResponseWithMissingIds[schemas.Cat],
+    responses=NOT_MODIFIED_RESPONSES,
 )
 async def get_cats(
     sql_uow: SQLUnitOfWorkDep,
     service: cat_service,
-    page: int = Query(1, ge=1),
-    per_page: int = Query(PAGINATION_PER_PAGE, ge=1),
-) -> PaginatedResponse[schemas.Cat]:
-    return await service.get_cats(
-        sql_uow=sql_uow,
-        page=page,
-        per_page=per_page,
-    )
+    params: Annotated[schemas.CatListParams, Query()],
+    response: Response,
+    if_none_match: str | None = Header(None),
+) -> schemas.PaginatedResponseWithMissingIds[schemas.Cat] | Response:
+    cats = await service.get_cats(sql_uow=sql_uow, params=params)
+
+    etag = make_collection_etag(cats)
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    response.headers["ETag"] = etag
+    return cats
+
+
+@router.get(
+    "s/search",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.SearchResponse[schemas.Cat],
+)
+async def search_cats(
+    sql_uow: SQLUnitOfWorkDep,
+    service: cat_service,
+    params: Annotated[schemas.SearchParams, Query()],
+) -> schemas.SearchResponse[schemas.Cat]:
+    return await service.search_cats(sql_uow=sql_uow, params=params)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=schemas.Cat)
@@ -40,17 +64,33 @@ async def create_cat(
     request: schemas.CatCreateRequest,
     sql_uow: SQLUnitOfWorkDep,
     service: cat_service,
+    key: idempotency_key = None,
 ) -> schemas.Cat:
-    return await service.create_cat(sql_uow=sql_uow, data=request)
+    return await service.create_cat(sql_uow=sql_uow, data=request, idempotency_key=key)
 
 
-@router.get("/{cat_id}", status_code=status.HTTP_200_OK, response_model=schemas.Cat)
+@router.get(
+    "/{cat_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.Cat,
+    responses=NOT_MODIFIED_RESPONSES,
+)
 async def get_cat(
     sql_uow: SQLUnitOfWorkDep,
     service: cat_service,
     cat_id: UUID,
-) -> schemas.Cat:
-    return await service.get_cat_by_id(sql_uow=sql_uow, cat_id=cat_id)
+    response: Response,
+    if_none_match: str | None = Header(None),
+) -> schemas.Cat | Response:
+    if if_none_match:
+        etag = make_etag(*await service.get_cat_version(sql_uow=sql_uow, cat_id=cat_id))
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+
+    cat = await service.get_cat_by_id(sql_uow=sql_uow, cat_id=cat_id)
+
+    response.headers["ETag"] = make_etag(cat.id, cat.updated_at)
+    return cat
 
 
 @router.patch("/{cat_id}", status_code=status.HTTP_200_OK, response_model=schemas.Cat)
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Request
+from starlette import status
+
+from app.core.exceptions import NotReadyException
+
+__all__ = ["router"]
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+async def get_readiness(request: Request) -> dict[str, str]:
+    """Ready once the database pool is warmed up."""
+    if not getattr(request.app.state, "ready", False):
+        raise NotReadyException()
+
+    return {"status": "ready"}
@@ -1,7 +1,10 @@
 from fastapi import APIRouter
 
 from app.api.routers.cat import router as cat_router
+from app.api.routers.health import router as health_router
+from app.api.routers.metrics import router as metrics_router
 from app.api.routers.mission import router as mission_router
+from app.api.routers.target import router as target_router
 
 __all__ = ["router"]
 
@@ -10,3 +13,6 @@ router = APIRouter(prefix="/api")
 
 router.include_router(cat_router)
 router.include_router(mission_router)
+router.include_router(target_router)
+router.include_router(metrics_router)
+router.include_router(health_router)
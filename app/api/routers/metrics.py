@@ -0,0 +1,15 @@
+from typing import Any
+
+from fastapi import APIRouter
+from starlette import status
+
+from app.core.metrics import metrics_registry
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def get_metrics() -> dict[str, dict[str, Any]]:
+    return metrics_registry.collect()
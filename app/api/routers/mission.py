@@ -1,16 +1,30 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from starlette import status
 
 from app import schemas
 from app.api.dependencies import (
+    BulkSQLUnitOfWorkDep,
     SQLUnitOfWorkDep,
+    idempotency_key,
     mission_service,
+    return_preference,
 )
-from app.core.constants.base import PAGINATION_PER_PAGE
-
-from app.schemas import PaginatedResponse
+from app.api.conditional import (
+    NOT_MODIFIED_RESPONSES,
+    is_not_modified,
+    make_collection_etag,
+    make_etag,
+    not_modified_response,
+)
+from app.core.constants.base import CHANGE_FEED_HEARTBEAT_SECONDS
+from app.infra.change_feed import change_feed_listener
 
 __all__ = ["router"]
 
@@ -20,41 +34,145 @@ router = APIRouter(prefix="/mission", tags=["Missions"])
 @router.get(
     "s",
     status_code=status.HTTP_200_OK,
-    response_model=PaginatedResponse[schemas.Mission],
+    response_model=schemas.PaginatedResponseWithMissingIds[schemas.MissionWithRelations],
+    responses=NOT_MODIFIED_RESPONSES,
 )
 async def get_missions(
     sql_uow: SQLUnitOfWorkDep,
     service: mission_service,
-    page: int = Query(1, ge=1),
-    per_page: int = Query(PAGINATION_PER_PAGE, ge=1),
-) -> PaginatedResponse[schemas.Mission]:
-    return await service.get_missions(
-        sql_uow=sql_uow,
-        page=page,
-        per_page=per_page,
+    params: Annotated[schemas.MissionListParams, Query()],
+    response: Response,
+    if_none_match: str | None = Header(None),
+) -> schemas.PaginatedResponseWithMissingIds[schemas.MissionWithRelations] | Response:
+    missions = await service.get_missions(sql_uow=sql_uow, params=params)
+
+    etag = make_collection_etag(missions, params.include)
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    response.headers["ETag"] = etag
+    return missions
+
+
+@router.get(
+    "s/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}},
+)
+async def stream_mission_changes(
+    params: Annotated[schemas.MissionStreamParams, Query()],
+) -> StreamingResponse:
+    """Server-sent events with mission and target changes, optionally limited to the given missions."""
+    return StreamingResponse(
+        _mission_change_events(mission_ids=params.mission_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+async def _mission_change_events(mission_ids: list[UUID] | None) -> AsyncIterator[str]:
+    async with change_feed_listener.subscribe(mission_ids=mission_ids) as events:
+        while True:
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=CHANGE_FEED_HEARTBEAT_SECONDS)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            yield f"event: {event.type}\ndata: {event.model_dump_json(exclude_none=True)}\n\n"
+
+
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=schemas.Mission)
 async def create_mission(
     request: schemas.MissionCreateRequest,
     sql_uow: SQLUnitOfWorkDep,
     service: mission_service,
+    key: idempotency_key = None,
 ) -> schemas.Mission:
-    return await service.create_mission(sql_uow=sql_uow, data=request)
+    return await service.create_mission(sql_uow=sql_uow, data=request, idempotency_key=key)
 
 
 @router.get(
     "/{mission_id}",
     status_code=status.HTTP_200_OK,
-    response_model=schemas.MissionWithTargets,
+    response_model=schemas.MissionWithTargets | schemas.MissionWithTargetCounts,
+    responses=NOT_MODIFIED_RESPONSES,
 )
 async def get_mission(
     sql_uow: SQLUnitOfWorkDep,
     service: mission_service,
     mission_id: UUID,
-) -> schemas.MissionWithTargets:
-    return await service.get_mission_by_id(sql_uow=sql_uow, mission_id=mission_id)
+    response: Response,
+    view: schemas.MissionView = Query(
+        "full", description="'full' embeds all targets, 'summary' returns target counts instead"
+    ),
+    if_none_match: str | None = Header(None),
+) -> schemas.MissionWithTargets | schemas.MissionWithTargetCounts | Response:
+    if if_none_match:
+        etag = _mission_etag(view, *await service.get_mission_version(sql_uow=sql_uow, mission_id=mission_id))
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+
+    mission = await service.get_mission_by_id(sql_uow=sql_uow, mission_id=mission_id, view=view)
+
+    if isinstance(mission, schemas.MissionWithTargetCounts):
+        etag = _mission_etag(
+            view, mission.id, mission.updated_at, None, mission.targets_count, mission.completed_targets_count
+        )
+    else:
+        etag = _mission_etag(
+            view,
+            mission.id,
+            mission.updated_at,
+            max((target.updated_at for target in mission.targets), default=None),
+            len(mission.targets),
+            sum(target.complete for target in mission.targets),
+        )
+
+    response.headers["ETag"] = etag
+    return mission
+
+
+def _mission_etag(
+    view: schemas.MissionView,
+    mission_id: UUID,
+    updated_at: datetime,
+    targets_updated_at: datetime | None,
+    targets_count: int,
+    completed_targets_count: int,
+) -> str:
+    """
+    ETag of a single mission, the same whether computed from `get_mission_version` or from the loaded mission.
+    The summary doesn't show the targets, so only their counts are part of its version.
+    """
+    if view == "summary":
+        return make_etag(view, mission_id, updated_at, targets_count, completed_targets_count)
+    return make_etag(view, mission_id, updated_at, targets_updated_at, targets_count)
+
+
+@router.get(
+    "/{mission_id}/targets",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.CursorPaginatedResponse[schemas.Target],
+    responses=NOT_MODIFIED_RESPONSES,
+)
+async def get_mission_targets(
+    sql_uow: SQLUnitOfWorkDep,
+    service: mission_service,
+    mission_id: UUID,
+    params: Annotated[schemas.TargetListParams, Query()],
+    response: Response,
+    if_none_match: str | None = Header(None),
+) -> schemas.CursorPaginatedResponse[schemas.Target] | Response:
+    targets = await service.get_mission_targets(sql_uow=sql_uow, mission_id=mission_id, params=params)
+
+    etag = make_collection_etag(targets)
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    response.headers["ETag"] = etag
+    return targets
 
 
 @router.delete("/{mission_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -83,7 +201,7 @@ async def assign_cat_to_mission(
 @router.patch(
     "/{mission_id}/target/{target_id}",
     status_code=status.HTTP_200_OK,
-    response_model=schemas.MissionWithTargets,
+    response_model=schemas.MissionWithTargets | schemas.TargetUpdateResult,
 )
 async def update_mission_target(
     sql_uow: SQLUnitOfWorkDep,
@@ -91,7 +209,29 @@ async def update_mission_target(
     mission_id: UUID,
     target_id: UUID,
     request: schemas.TargetUpdateRequest,
-) -> schemas.MissionWithTargets:
+    preference: return_preference,
+    response: Response,
+) -> schemas.MissionWithTargets | schemas.TargetUpdateResult:
+    if preference is not None:
+        response.headers["Preference-Applied"] = f"return={preference}"
     return await service.update_mission_target(
-        sql_uow=sql_uow, mission_id=mission_id, target_id=target_id, request=request
+        sql_uow=sql_uow,
+        mission_id=mission_id,
+        target_id=target_id,
+        request=request,
+        minimal=preference == "minimal",
     )
+
+
+@router.patch(
+    "/{mission_id}/targets",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.TargetBatchUpdateResult,
+)
+async def update_mission_targets(
+    sql_uow: BulkSQLUnitOfWorkDep,
+    service: mission_service,
+    mission_id: UUID,
+    request: schemas.TargetBatchUpdateRequest,
+) -> schemas.TargetBatchUpdateResult:
+    return await service.update_mission_targets(sql_uow=sql_uow, mission_id=mission_id, request=request)
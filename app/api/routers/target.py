@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+from starlette import status
+
+from app import schemas
+from app.api.dependencies import (
+    SQLUnitOfWorkDep,
+    mission_service,
+)
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/target", tags=["Targets"])
+
+
+@router.get(
+    "s/search",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.SearchResponse[schemas.Target],
+)
+async def search_targets(
+    sql_uow: SQLUnitOfWorkDep,
+    service: mission_service,
+    params: Annotated[schemas.SearchParams, Query()],
+) -> schemas.SearchResponse[schemas.Target]:
+    return await service.search_targets(sql_uow=sql_uow, params=params)
@@ -0,0 +1,145 @@
+"""
+Benchmarks the overhead of repository calls.
+
+Without arguments it measures, without a database, the CPU time spent preparing the statements of the hottest
+repository calls: `per-call` parses the filters and builds the statement on every call, as the repositories did
+before statement templates; `template` is what they do now. Both include SQLAlchemy's cache key generation,
+which every execution needs to find the compiled SQL in the engine's cache.
+
+With `--database` it also runs the same calls against the configured database, through the ORM and through the
+fast read path, and reports wall and CPU time.
+
+    python -m app.benchmarks.repository [--iterations N] [--database]
+"""
+
+import argparse
+import asyncio
+import functools
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.infra.database import dispose_engines
+from app.repositories.base import (
+    RepositoryMixin,
+    _build_statement,
+    _filter_spec,
+    _statement_template,
+)
+from app.repositories.cat import CatRepository
+from app.repositories.mission import MissionRepository
+from app.repositories.target import TargetRepository
+from app.uow.sql import SQLUnitOfWork
+
+CALLS: list[tuple[str, type[RepositoryMixin], tuple[Any, ...], Callable[[], dict[str, Any]]]] = [
+    ("get by id", CatRepository, ("select",), lambda: {"id": uuid.uuid4()}),
+    (
+        "count incomplete targets",
+        TargetRepository,
+        ("count",),
+        lambda: {"mission_id": uuid.uuid4(), "complete": False},
+    ),
+    (
+        "filtered cat page",
+        CatRepository,
+        ("page", "-name"),
+        lambda: {"name__ilike": "%tom%", "breed__in": ["Siamese", "Bengal"], "years_of_experience__ge": 2},
+    ),
+    ("mission page", MissionRepository, ("page", None), lambda: {"complete": False}),
+]
+
+
+def _per_call(repository: type[RepositoryMixin], kind: tuple[Any, ...], filters: dict[str, Any]) -> None:
+    spec = _filter_spec.__wrapped__(repository.model, tuple(filters))
+    where = [getattr(column, action)(value) for (column, action, _), value in zip(spec, filters.values())]
+    _build_statement(repository.model, kind, where)._generate_cache_key()
+
+
+def _template(repository: RepositoryMixin, kind: tuple[Any, ...], filters: dict[str, Any]) -> None:
+    statement, _ = repository._filtered_statement(kind, filters)
+    statement._generate_cache_key()
+
+
+def _measure(func: Callable[[], None], iterations: int) -> float:
+    func()
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+def benchmark_statements(iterations: int) -> None:
+    print("Statement preparation, CPU µs per call")
+    print(f"{'call':<28}{'per-call':>10}{'template':>10}{'speedup':>10}")
+    for name, repository, kind, make_filters in CALLS:
+        filters = make_filters()
+        per_call = _measure(functools.partial(_per_call, repository, kind, filters), iterations)
+        instance = repository(session=None)  # type: ignore[arg-type]
+        template = _measure(functools.partial(_template, instance, kind, filters), iterations)
+        print(f"{name:<28}{per_call:>10.1f}{template:>10.1f}{per_call / template:>9.1f}x")
+    print(_statement_template.cache_info())
+
+
+async def _run_call(iterations: int, call: Callable[[SQLUnitOfWork], Awaitable[Any]]) -> tuple[float, float]:
+    sql_uow = SQLUnitOfWork()
+    async with sql_uow:
+        await call(sql_uow)
+        started, started_cpu = time.perf_counter(), time.process_time()
+        for _ in range(iterations):
+            await call(sql_uow)
+        elapsed, elapsed_cpu = time.perf_counter() - started, time.process_time() - started_cpu
+    return elapsed / iterations * 1_000_000, elapsed_cpu / iterations * 1_000_000
+
+
+async def benchmark_database(iterations: int) -> None:
+    calls: list[tuple[str, Callable[[SQLUnitOfWork], Awaitable[Any]]]] = [
+        ("get by id", lambda uow: uow.cat.get_one_or_none(filters={"id": uuid.uuid4()})),
+        (
+            "count incomplete targets",
+            lambda uow: uow.target.count(filters={"mission_id": uuid.uuid4(), "complete": False}),
+        ),
+        (
+            "filtered cat page",
+            lambda uow: uow.cat.get_multi(
+                order_by="-name",
+                return_scheme=True,
+                name__ilike="%tom%",
+                breed__in=["Siamese", "Bengal"],
+                years_of_experience__ge=2,
+            ),
+        ),
+        ("mission page", lambda uow: uow.mission.get_multi_with_relations(include=(), complete=False)),
+        ("get by id (fast)", lambda uow: uow.fast_cat.get_multi_without_pagination(id=uuid.uuid4())),
+        (
+            "filtered cat page (fast)",
+            lambda uow: uow.fast_cat.get_multi(
+                order_by="-name", name__ilike="%tom%", breed__in=["Siamese", "Bengal"], years_of_experience__ge=2
+            ),
+        ),
+        ("mission page (fast)", lambda uow: uow.fast_mission.get_multi_with_relations(complete=False)),
+    ]
+
+    print("Repository calls against the database, µs per call")
+    print(f"{'call':<28}{'wall':>10}{'cpu':>10}")
+    try:
+        for name, call in calls:
+            wall, cpu = await _run_call(iterations, call)
+            print(f"{name:<28}{wall:>10.1f}{cpu:>10.1f}")
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark repository call overhead")
+    parser.add_argument("--iterations", type=int, default=10_000)
+    parser.add_argument("--database", action="store_true", help="also run the calls against the configured database")
+    args = parser.parse_args()
+
+    benchmark_statements(args.iterations)
+    if args.database:
+        asyncio.run(benchmark_database(max(1, args.iterations // 10)))
+
+
+if __name__ == "__main__":
+    main()
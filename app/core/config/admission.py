@@ -0,0 +1,32 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class AdmissionConfig(BaseConfig):
+    """
+    Concurrency limits per route class. Together they should not exceed POOL_SIZE + MAX_OVERFLOW,
+    so that admitted requests don't queue again for a database connection.
+    Like the pool sizes, the limits are split across the worker processes.
+    """
+
+    READ_CONCURRENCY: int = Field(40, alias="ADMISSION_READ_CONCURRENCY")
+    READ_QUEUE_SIZE: int = Field(200, alias="ADMISSION_READ_QUEUE_SIZE")
+    READ_MAX_WAIT_SECONDS: float = Field(2.0, alias="ADMISSION_READ_MAX_WAIT_SECONDS")
+
+    WRITE_CONCURRENCY: int = Field(15, alias="ADMISSION_WRITE_CONCURRENCY")
+    WRITE_QUEUE_SIZE: int = Field(100, alias="ADMISSION_WRITE_QUEUE_SIZE")
+    WRITE_MAX_WAIT_SECONDS: float = Field(5.0, alias="ADMISSION_WRITE_MAX_WAIT_SECONDS")
+
+    BULK_CONCURRENCY: int = Field(5, alias="ADMISSION_BULK_CONCURRENCY")
+    BULK_QUEUE_SIZE: int = Field(20, alias="ADMISSION_BULK_QUEUE_SIZE")
+    BULK_MAX_WAIT_SECONDS: float = Field(10.0, alias="ADMISSION_BULK_MAX_WAIT_SECONDS")
+
+    RETRY_AFTER_SECONDS: int = Field(1, alias="ADMISSION_RETRY_AFTER_SECONDS")
+
+    # Time budget of a request, including the wait for admission; passed on to Postgres as statement_timeout
+    READ_DEADLINE_SECONDS: float = Field(5.0, alias="READ_DEADLINE_SECONDS")
+    WRITE_DEADLINE_SECONDS: float = Field(10.0, alias="WRITE_DEADLINE_SECONDS")
+    BULK_DEADLINE_SECONDS: float = Field(30.0, alias="BULK_DEADLINE_SECONDS")
+    # Longest a statement waits for a row or table lock, within the deadline
+    LOCK_TIMEOUT_SECONDS: float = Field(2.0, alias="LOCK_TIMEOUT_SECONDS")
@@ -1,7 +1,21 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-__all__ = ["BaseConfig"]
+__all__ = ["BaseConfig", "per_worker"]
 
 
 class BaseConfig(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
+
+
+def per_worker(total: int, workers: int, minimum: int = 1) -> int:
+    """
+    Share of a process-wide limit for one of `workers` processes, so that the sum stays within `total`.
+    Non-positive totals (no limit, nothing) are taken as they are. A share below `minimum` is refused,
+    as raising it would push the sum over `total`.
+    """
+    if total <= 0:
+        return total
+    share = total // workers
+    if share < minimum:
+        raise ValueError(f"A limit of {total} can't give each of {workers} workers at least {minimum}")
+    return share
@@ -1,9 +1,16 @@
 from typing import Literal
 
+from pydantic import model_validator
 
-from app.core.config.base import BaseConfig
+from app.core.config.admission import AdmissionConfig
+from app.core.config.base import BaseConfig, per_worker
 from app.core.config.cat_api import CatApiConfig
 from app.core.config.db import DataBaseConfig
+from app.core.config.log import LogConfig
+from app.core.config.loop_monitor import LoopMonitorConfig
+from app.core.config.profiling import ProfilingConfig
+from app.core.config.tracing import TracingConfig
+from app.enums.database import DatabasePool
 
 
 class Settings(BaseConfig):
@@ -12,14 +19,49 @@ class Settings(BaseConfig):
     RELOAD: bool = False
     EXECUTION_MODE: Literal["PRODUCTION", "DEVELOPMENT"] = "DEVELOPMENT"
 
+    # Production runner
+    WORKERS: int = 1
+    LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    HTTP: Literal["auto", "h11", "httptools"] = "auto"
+    LIMIT_MAX_REQUESTS: int | None = None
+    TIMEOUT_GRACEFUL_SHUTDOWN: int = 30
+
     ALLOW_ORIGINS: list[str]
 
     db: DataBaseConfig = DataBaseConfig()
     cat_api: CatApiConfig = CatApiConfig()
+    admission: AdmissionConfig = AdmissionConfig()
+    log: LogConfig = LogConfig()
+    tracing: TracingConfig = TracingConfig()
+    profiling: ProfilingConfig = ProfilingConfig()
+    loop_monitor: LoopMonitorConfig = LoopMonitorConfig()
 
     @property
     def is_production(self) -> bool:
         return self.EXECUTION_MODE == "PRODUCTION"
 
+    @property
+    def worker_processes(self) -> int:
+        """Number of worker processes actually started; uvicorn runs a single one when reloading."""
+        return 1 if self.RELOAD else self.WORKERS
+
+    @model_validator(mode="after")
+    def check_worker_shares(self) -> "Settings":
+        """
+        Splits every pool size and admission limit across the workers up front, so a limit too small for
+        the number of workers fails at startup rather than when its pool or limiter is first used.
+        """
+        for pool in DatabasePool:
+            try:
+                self.db.pool_options(pool, workers=self.worker_processes)
+            except ValueError as e:
+                raise ValueError(f"{pool} pool: {e}") from e
+        for name in ("READ_CONCURRENCY", "WRITE_CONCURRENCY", "BULK_CONCURRENCY"):
+            try:
+                per_worker(getattr(self.admission, name), self.worker_processes)
+            except ValueError as e:
+                raise ValueError(f"ADMISSION_{name}: {e}") from e
+        return self
+
 
 settings = Settings()
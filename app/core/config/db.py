@@ -1,6 +1,9 @@
+from typing import Any
+
 from pydantic import Field
 
-from app.core.config.base import BaseConfig
+from app.core.config.base import BaseConfig, per_worker
+from app.enums.database import DatabasePool
 
 
 class DataBaseConfig(BaseConfig):
@@ -11,11 +14,52 @@ class DataBaseConfig(BaseConfig):
     DB: str = Field(..., alias="POSTGRES_DB")
     DATA_VOLUME_NAME: str = "pg_volume"
 
+    # Interactive pool, used by request handlers
     POOL_SIZE: int = 50
     MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 10
     POOL_RECYCLE: int = 1800
 
+    # Interactive connections opened and primed on startup
+    WARMUP_CONNECTIONS: int = 10
+    WARMUP_TIMEOUT_SECONDS: float = 30
+
+    # Bulk pool, used by requests that read or write many rows at once
+    BULK_POOL_SIZE: int = 5
+    BULK_MAX_OVERFLOW: int = 0
+    BULK_POOL_TIMEOUT: float = 60
+
+    # Background pool, used by periodic jobs
+    BACKGROUND_POOL_SIZE: int = 4
+    BACKGROUND_MAX_OVERFLOW: int = 0
+    BACKGROUND_POOL_TIMEOUT: float = 30
+
+    # statement_timeout every connection is opened with (0 keeps the server's). A transaction with at least this
+    # much of its deadline left keeps it instead of setting its own timeouts, which costs a round trip
+    STATEMENT_TIMEOUT_SECONDS: float = 0
+
+    # Serve the hottest reads with plain SQL on the asyncpg connection instead of the ORM
+    FAST_READS: bool = False
+
+    def pool_options(self, pool: DatabasePool, workers: int = 1) -> dict[str, Any]:
+        """
+        Engine pool arguments of the named pool for one of `workers` processes.
+        Sizes are totals for the whole server, so they are split across the worker processes.
+        """
+        prefix = "" if pool is DatabasePool.interactive else f"{pool.upper()}_"
+        return {
+            "pool_size": per_worker(getattr(self, f"{prefix}POOL_SIZE"), workers),
+            "max_overflow": per_worker(getattr(self, f"{prefix}MAX_OVERFLOW"), workers, minimum=0),
+            "pool_timeout": getattr(self, f"{prefix}POOL_TIMEOUT"),
+            "pool_recycle": self.POOL_RECYCLE,
+        }
+
     @property
     def url(self) -> str:
         """Constructs the SQLAlchemy URL using the database configuration."""
         return f"postgresql+asyncpg://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB}"
+
+    @property
+    def dsn(self) -> str:
+        """Plain PostgreSQL DSN for direct asyncpg connections."""
+        return f"postgresql://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB}"
@@ -0,0 +1,12 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class LogConfig(BaseConfig):
+    LEVEL: str = Field("DEBUG", alias="LOG_LEVEL")
+    JSON: bool = Field(False, alias="LOG_JSON")
+
+    # At most RATE_LIMIT records per exception class every RATE_WINDOW_SECONDS, the rest are counted and dropped
+    RATE_LIMIT: int = Field(10, alias="LOG_RATE_LIMIT")
+    RATE_WINDOW_SECONDS: float = Field(1.0, alias="LOG_RATE_WINDOW_SECONDS")
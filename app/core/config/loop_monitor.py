@@ -0,0 +1,12 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class LoopMonitorConfig(BaseConfig):
+    ENABLED: bool = Field(True, alias="LOOP_MONITOR_ENABLED")
+    INTERVAL_SECONDS: float = Field(0.25, alias="LOOP_MONITOR_INTERVAL_SECONDS")
+    # Lag above which the loop counts as blocked and the blocking stack is logged
+    THRESHOLD_SECONDS: float = Field(0.1, alias="LOOP_MONITOR_THRESHOLD_SECONDS")
+    # asyncio debug mode: reports every callback or task step running longer than THRESHOLD_SECONDS. Slow.
+    DEBUG: bool = Field(False, alias="LOOP_MONITOR_DEBUG")
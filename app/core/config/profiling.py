@@ -0,0 +1,15 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class ProfilingConfig(BaseConfig):
+    """On-demand request profiling. Only honoured outside of production."""
+
+    ENABLED: bool = Field(False, alias="PROFILING_ENABLED")
+    HEADER: str = Field("X-Profile", alias="PROFILING_HEADER")
+    QUERY_PARAM: str = Field("profile", alias="PROFILING_QUERY_PARAM")
+
+    SAMPLE_INTERVAL_SECONDS: float = Field(0.001, alias="PROFILING_SAMPLE_INTERVAL_SECONDS")
+    TOP_ALLOCATIONS: int = Field(25, alias="PROFILING_TOP_ALLOCATIONS")
+    OUTPUT_DIR: str = Field("profiles", alias="PROFILING_OUTPUT_DIR")
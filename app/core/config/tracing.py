@@ -0,0 +1,20 @@
+from typing import Literal
+
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class TracingConfig(BaseConfig):
+    ENABLED: bool = Field(False, alias="TRACING_ENABLED")
+    SERVICE_NAME: str = Field("spy-cat-agency-api", alias="TRACING_SERVICE_NAME")
+    # Share of requests traced, between 0 and 1; requests with a sampled `traceparent` are always traced
+    SAMPLE_RATE: float = Field(1.0, ge=0, le=1, alias="TRACING_SAMPLE_RATE")
+
+    EXPORTER: Literal["file", "otlp"] = Field("file", alias="TRACING_EXPORTER")
+    FILE_PATH: str = Field("traces.jsonl", alias="TRACING_FILE_PATH")
+    OTLP_ENDPOINT: str = Field("http://localhost:4318/v1/traces", alias="TRACING_OTLP_ENDPOINT")
+
+    BUFFER_SIZE: int = Field(10_000, alias="TRACING_BUFFER_SIZE")
+    FLUSH_INTERVAL_SECONDS: float = Field(5.0, alias="TRACING_FLUSH_INTERVAL_SECONDS")
+    MAX_STATEMENT_LENGTH: int = Field(1000, alias="TRACING_MAX_STATEMENT_LENGTH")
@@ -1 +1,21 @@
 PAGINATION_PER_PAGE = 10
+MAX_PER_PAGE = 100
+MAX_IDS_PER_REQUEST = 100
+# Matches of a text search that are ranked and counted; past it the count is reported as capped
+SEARCH_MAX_MATCHES = 1000
+
+# Rows a bulk write takes from its input at a time, and values per chunk of a bulk update's IN filter,
+# which stays below the 32767 bind parameters Postgres accepts per statement
+BULK_WRITE_CHUNK_ROWS = 5000
+BULK_READ_BATCH_ROWS = 1000
+# Parsed filters and statement templates kept per model and filter shape
+STATEMENT_CACHE_SIZE = 1024
+
+MISSION_CHANGES_CHANNEL = "mission_changes"
+# NOTIFY payloads must be shorter than 8000 bytes
+NOTIFY_PAYLOAD_LIMIT = 7999
+CHANGE_FEED_QUEUE_SIZE = 100
+CHANGE_FEED_HEARTBEAT_SECONDS = 15
+
+IDEMPOTENCY_KEY_TTL_SECONDS = 24 * 60 * 60
+IDEMPOTENCY_KEY_CLEANUP_INTERVAL_SECONDS = 60 * 60
@@ -13,6 +13,11 @@ __all__ = [
     "GoneException",
     "ForbiddenException",
     "BadRequestException",
+    "ServiceOverloadedException",
+    "NotReadyException",
+    "DeadlineExceededException",
+    "ResourceBusyException",
+    "IdempotencyKeyReusedException",
 ]
 
 
@@ -125,3 +130,53 @@ class BadRequestException(BaseHTTPException):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.sentry_group = BadRequestException.__name__
         super().__init__(*args, **kwargs)
+
+
+class ServiceOverloadedException(BaseHTTPException):
+    message_pattern = ("Too many concurrent {0} requests, retry later", "route_class")
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    _exception_alias = MessageException.service_overloaded
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.sentry_group = ServiceOverloadedException.__name__
+        super().__init__(*args, **kwargs)
+
+
+class NotReadyException(BaseHTTPException):
+    message_pattern = ("Application is not ready to serve requests",)
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    _exception_alias = MessageException.not_ready
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.sentry_group = NotReadyException.__name__
+        super().__init__(*args, **kwargs)
+
+
+class DeadlineExceededException(BaseHTTPException):
+    message_pattern = ("Request did not complete within its deadline",)
+    status_code = status.HTTP_504_GATEWAY_TIMEOUT
+    _exception_alias = MessageException.deadline_exceeded
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.sentry_group = DeadlineExceededException.__name__
+        super().__init__(*args, **kwargs)
+
+
+class ResourceBusyException(BaseHTTPException):
+    message_pattern = ("Resource is locked by another request, retry later",)
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    _exception_alias = MessageException.resource_busy
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.sentry_group = ResourceBusyException.__name__
+        super().__init__(*args, **kwargs)
+
+
+class IdempotencyKeyReusedException(BaseHTTPException):
+    message_pattern = ("Idempotency-Key {0} has already been used for a different request", "key")
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    _exception_alias = MessageException.idempotency_key_reused
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.sentry_group = IdempotencyKeyReusedException.__name__
+        super().__init__(*args, **kwargs)
@@ -1,6 +1,70 @@
+import sys
+import time
+
 from loguru import logger
 
 from collections.abc import Callable
+from typing import Any
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+__all__ = ["LoggerMixin", "LogSampler", "log_sampler", "configure_logging"]
+
+
+class LogSampler:
+    """
+    Lets through at most `limit` records per key in every `window` seconds and counts the dropped ones,
+    so that a burst of identical errors costs a counter increment instead of a log write each.
+    """
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        # key -> [window start, records let through, records dropped]
+        self._windows: dict[str, list[Any]] = {}
+        self.dropped_total: dict[str, int] = {}
+
+    def acquire(self, key: str) -> int | None:
+        """Returns None when the record should be dropped, otherwise how many were dropped before it."""
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.window:
+            dropped = window[2] if window else 0
+            self._windows[key] = [now, 1, 0]
+            return dropped
+
+        if window[1] < self.limit:
+            window[1] += 1
+            return 0
+
+        window[2] += 1
+        self.dropped_total[key] = self.dropped_total.get(key, 0) + 1
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        return {"dropped": dict(self.dropped_total)}
+
+
+log_sampler = LogSampler(limit=settings.log.RATE_LIMIT, window=settings.log.RATE_WINDOW_SECONDS)
+
+metrics_registry.register("logging", log_sampler.stats)
+
+
+def configure_logging() -> None:
+    """
+    Replaces the default sink with one written from a background thread (`enqueue=True`),
+    so that request handlers only put the record on a queue.
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=settings.log.LEVEL,
+        serialize=settings.log.JSON,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+    )
 
 
 class LoggerMixin:
@@ -9,7 +73,12 @@ class LoggerMixin:
 
     def log_exception(self, detail: str | None = None) -> None:
         if self.log_level in {"debug", "info", "warning", "error", "critical", "exception"}:
-            logger_method: Callable = getattr(logger, self.log_level)
+            dropped = log_sampler.acquire(type(self).__name__)
+            if dropped is None:
+                return
+
+            bound_logger = logger.bind(exception_class=type(self).__name__, dropped=dropped)
+            logger_method: Callable = getattr(bound_logger, self.log_level)
 
             if self.log_message_pattern:
                 log_message, *args = self.log_message_pattern
@@ -0,0 +1,20 @@
+from collections.abc import Callable
+from typing import Any
+
+__all__ = ["MetricsRegistry", "metrics_registry"]
+
+
+class MetricsRegistry:
+    """Components register a callable returning their current metrics; GET /api/metrics collects them."""
+
+    def __init__(self) -> None:
+        self._providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def register(self, name: str, provider: Callable[[], dict[str, Any]]) -> None:
+        self._providers[name] = provider
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        return {name: provider() for name, provider in self._providers.items()}
+
+
+metrics_registry = MetricsRegistry()
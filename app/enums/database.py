@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class DatabasePool(StrEnum):
+    interactive = "interactive"
+    bulk = "bulk"
+    background = "background"
@@ -7,3 +7,8 @@ class MessageException(StrEnum):
     gone = "gone"
     forbidden = "forbidden"
     bad_request = "bad_request"
+    service_overloaded = "service_overloaded"
+    not_ready = "not_ready"
+    deadline_exceeded = "deadline_exceeded"
+    resource_busy = "resource_busy"
+    idempotency_key_reused = "idempotency_key_reused"
@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Collection
+from uuid import UUID
+
+import asyncpg
+from loguru import logger
+
+from app import schemas
+from app.core import settings
+from app.core.constants.base import CHANGE_FEED_QUEUE_SIZE, MISSION_CHANGES_CHANNEL
+
+__all__ = ["ChangeFeedListener", "change_feed_listener"]
+
+RECONNECT_DELAY_SECONDS = 1
+
+
+class _Subscriber:
+    def __init__(self, mission_ids: Collection[UUID] | None) -> None:
+        self.mission_ids = set(mission_ids) if mission_ids else None
+        self.queue: asyncio.Queue[schemas.MissionChangeEvent] = asyncio.Queue(maxsize=CHANGE_FEED_QUEUE_SIZE)
+
+    def put(self, event: schemas.MissionChangeEvent) -> None:
+        if self.mission_ids is not None and event.mission_id not in self.mission_ids:
+            return
+
+        if self.queue.full():
+            # a slow consumer loses its oldest events instead of holding back the others
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class ChangeFeedListener:
+    """
+    Holds one LISTEN connection per worker process and fans the mission change events out to subscribers.
+    The connection is opened with the first subscriber and re-established when it is lost.
+    """
+
+    def __init__(self, channel: str = MISSION_CHANGES_CHANNEL) -> None:
+        self._channel = channel
+        self._subscribers: set[_Subscriber] = set()
+        self._task: asyncio.Task | None = None
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self, mission_ids: Collection[UUID] | None = None
+    ) -> AsyncIterator[asyncio.Queue[schemas.MissionChangeEvent]]:
+        subscriber = _Subscriber(mission_ids=mission_ids)
+        self._subscribers.add(subscriber)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+        try:
+            yield subscriber.queue
+        finally:
+            self._subscribers.discard(subscriber)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _on_notification(self, _connection: object, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            event = schemas.MissionChangeEvent.model_validate_json(payload)
+        except ValueError:
+            logger.warning("Skipping malformed change event: {payload}", payload=payload)
+            return
+
+        for subscriber in list(self._subscribers):
+            subscriber.put(event)
+
+    async def _listen(self) -> None:
+        while True:
+            connection: asyncpg.Connection | None = None
+            try:
+                connection = await asyncpg.connect(settings.db.dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(self._channel, self._on_notification)
+                logger.info("Listening for {channel} notifications", channel=self._channel)
+                await lost.wait()
+                logger.warning("Lost the {channel} listener connection", channel=self._channel)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.error("Failed to listen for {channel}: {error}", channel=self._channel, error=e)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+change_feed_listener = ChangeFeedListener()
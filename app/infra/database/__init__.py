@@ -1,3 +1,3 @@
-from app.infra.database.db import get_session_maker
+from app.infra.database.db import create_engine, dispose_engines, get_session_maker
 
-__all__ = ["get_session_maker"]
+__all__ = ["create_engine", "dispose_engines", "get_session_maker"]
@@ -0,0 +1,45 @@
+"""Trigram indexes for text search
+
+Revision ID: 00002
+Revises: 00001
+Create Date: 2026-10-19 10:12:41.204518
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "00002"
+down_revision: str | None = "00001"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+TRIGRAM_INDEXES = (
+    ("ix_spy_cats_name_trgm", "spy_cats", "name"),
+    ("ix_targets_name_trgm", "targets", "name"),
+    ("ix_targets_country_trgm", "targets", "country"),
+    ("ix_targets_notes_trgm", "targets", "notes"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for index_name, table_name, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,31 @@
+"""Keyset pagination index for mission targets
+
+Revision ID: 00003
+Revises: 00002
+Create Date: 2026-10-19 11:02:15.873120
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "00003"
+down_revision: str | None = "00002"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_targets_mission_id_created_at_id",
+        "targets",
+        ["mission_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_targets_mission_id_created_at_id", table_name="targets")
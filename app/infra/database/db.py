@@ -1,31 +1,50 @@
-import functools
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from app.core import settings
+from app.enums.database import DatabasePool
+from app.infra.tracing import instrument_engine, tracer
 
-__all__ = ["engine", "get_session_maker"]
+__all__ = ["engine", "create_engine", "dispose_engines", "get_session_maker"]
 
+_engines: dict[DatabasePool, AsyncEngine] = {}
+_session_makers: dict[DatabasePool, async_sessionmaker] = {}
 
-@functools.lru_cache
-def create_engine() -> AsyncEngine:
-    return create_async_engine(
-        settings.db.url,
-        pool_size=settings.db.POOL_SIZE,
-        max_overflow=settings.db.MAX_OVERFLOW,
-        pool_recycle=settings.db.POOL_RECYCLE,
-    )
 
+def _connect_args() -> dict[str, Any]:
+    """Session timeouts the connections start with, kept by transactions whose deadline leaves more time."""
+    if not settings.db.STATEMENT_TIMEOUT_SECONDS:
+        return {}
 
-@functools.lru_cache
-def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker:
-    return async_sessionmaker(bind=engine, autoflush=False)
+    statement_timeout = int(settings.db.STATEMENT_TIMEOUT_SECONDS * 1000)
+    lock_timeout = min(statement_timeout, int(settings.admission.LOCK_TIMEOUT_SECONDS * 1000))
+    return {"server_settings": {"statement_timeout": f"{statement_timeout}ms", "lock_timeout": f"{lock_timeout}ms"}}
 
 
-@functools.lru_cache
-def get_session_maker() -> async_sessionmaker:
-    engine = create_engine()
-    return create_sessionmaker(engine)
+def create_engine(pool: DatabasePool = DatabasePool.interactive) -> AsyncEngine:
+    """One engine, and so one connection pool, per workload class."""
+    if pool not in _engines:
+        _engines[pool] = create_async_engine(
+            settings.db.url,
+            connect_args=_connect_args(),
+            **settings.db.pool_options(pool, workers=settings.worker_processes),
+        )
+        if tracer.enabled:
+            instrument_engine(_engines[pool])
+    return _engines[pool]
+
+
+def get_session_maker(pool: DatabasePool = DatabasePool.interactive) -> async_sessionmaker:
+    if pool not in _session_makers:
+        _session_makers[pool] = async_sessionmaker(bind=create_engine(pool), autoflush=False)
+    return _session_makers[pool]
+
+
+async def dispose_engines() -> None:
+    """Closes the pooled connections of every engine created so far."""
+    for engine in _engines.values():
+        await engine.dispose()
 
 
 engine = create_engine()
@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from loguru import logger
+
+from app.core import settings
+from app.core.config.loop_monitor import LoopMonitorConfig
+from app.core.metrics import metrics_registry
+
+__all__ = ["LoopLagMonitor", "loop_monitor"]
+
+
+class _AsyncioLogHandler(logging.Handler):
+    """Forwards the slow callback reports of asyncio debug mode to loguru."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger.bind(source="asyncio").log(record.levelname, record.getMessage())
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a task sleeping for `INTERVAL_SECONDS`.
+    A watchdog thread notices when that wake-up is overdue by more than `THRESHOLD_SECONDS`
+    and logs the stack of the loop thread, i.e. the code blocking the loop while it still does.
+    """
+
+    def __init__(self, config: LoopMonitorConfig) -> None:
+        self.config = config
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self.config.DEBUG:
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.config.THRESHOLD_SECONDS
+            logging.getLogger("asyncio").addHandler(_AsyncioLogHandler())
+
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        if self._watchdog:
+            await asyncio.to_thread(self._watchdog.join)
+
+    async def _measure(self) -> None:
+        interval = self.config.INTERVAL_SECONDS
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self.lag = max(0.0, now - started - interval)
+            self.max_lag = max(self.max_lag, self.lag)
+            if self.lag >= self.config.THRESHOLD_SECONDS:
+                self.stalls += 1
+
+    def _watch(self) -> None:
+        if self._loop_thread_id is None:
+            return
+
+        reported_heartbeat = None
+        overdue_after = self.config.INTERVAL_SECONDS + self.config.THRESHOLD_SECONDS
+        while not self._stop.wait(self.config.THRESHOLD_SECONDS / 2):
+            heartbeat = self._heartbeat
+            if heartbeat == reported_heartbeat or time.monotonic() - heartbeat < overdue_after:
+                continue
+
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                logger.warning(
+                    "Event loop blocked for more than {threshold}s, loop thread stack:\n{stack}",
+                    threshold=self.config.THRESHOLD_SECONDS,
+                    stack="".join(traceback.format_stack(frame)),
+                )
+
+    def stats(self) -> dict[str, Any]:
+        return {"lag_seconds": self.lag, "max_lag_seconds": self.max_lag, "stalls": self.stalls}
+
+
+loop_monitor = LoopLagMonitor(settings.loop_monitor)
+
+metrics_registry.register("event_loop", loop_monitor.stats)
@@ -0,0 +1,177 @@
+import asyncio
+import contextlib
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from types import FrameType
+from urllib.parse import parse_qsl, urlencode
+
+from loguru import logger
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config.profiling import ProfilingConfig
+
+__all__ = ["SamplingProfiler", "AllocationTracker", "ProfilingMiddleware"]
+
+# Flag values: `cpu` or `memory` for one profiler, anything truthy for both
+PROFILE_MODES = {
+    "cpu": frozenset({"cpu"}),
+    "memory": frozenset({"memory"}),
+    **{value: frozenset({"cpu", "memory"}) for value in ("", "1", "true", "yes", "all")},
+}
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread from a background thread every `interval` seconds.
+    The result is in the folded format (`root;caller;callee count`) read by flamegraph.pl and speedscope.
+    It's a wall-clock profile: time the event loop spends waiting on I/O shows up under its selector.
+    """
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def __enter__(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._fold(frame)] += 1
+
+    @staticmethod
+    def _fold(frame: FrameType | None) -> str:
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            labels.append(f"{code.co_qualname} ({os.path.relpath(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class AllocationTracker:
+    """Memory allocated while the block runs, grouped by source line, plus the peak of traced memory."""
+
+    def __init__(self, top: int) -> None:
+        self.top = top
+        self.report = ""
+        self._started = False
+
+    def __enter__(self) -> "AllocationTracker":
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._before = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if self._started:
+            tracemalloc.stop()
+
+        ignored = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+        stats = after.filter_traces(ignored).compare_to(self._before.filter_traces(ignored), "lineno")
+        lines = [f"Peak traced memory: {peak / 1024:.1f} KiB", f"Top {self.top} allocations:"]
+        lines.extend(str(stat) for stat in stats[: self.top])
+        self.report = "\n".join(lines) + "\n"
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that carry the profiling header or query flag; the query flag is removed before routing.
+    tracemalloc slows down allocation-heavy code a lot, so `cpu` alone gives more faithful timings.
+    The CPU profile (`<id>.folded`) and the allocation report (`<id>.allocations.txt`) are written to
+    `OUTPUT_DIR`, and the id is returned in the `X-Profile-Id` header.
+    Profiled requests run one at a time, as both profilers see the whole process.
+    """
+
+    def __init__(self, app: ASGIApp, config: ProfilingConfig) -> None:
+        self.app = app
+        self.config = config
+        self._lock = asyncio.Lock()
+
+    def _requested_modes(self, scope: Scope) -> frozenset[str]:
+        flag = Headers(scope=scope).get(self.config.HEADER)
+
+        query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        flags = [value for key, value in query if key == self.config.QUERY_PARAM]
+        if flags:
+            remaining = [(key, value) for key, value in query if key != self.config.QUERY_PARAM]
+            scope["query_string"] = urlencode(remaining).encode("latin-1")
+            flag = flags[-1]
+
+        if flag is None:
+            return frozenset()
+        return PROFILE_MODES.get(flag.strip().lower(), frozenset())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        modes = self._requested_modes(scope) if scope["type"] == "http" else frozenset()
+        if not modes:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        async with self._lock:
+            profiler = SamplingProfiler(threading.get_ident(), self.config.SAMPLE_INTERVAL_SECONDS)
+            allocations = AllocationTracker(self.config.TOP_ALLOCATIONS)
+            started = time.perf_counter()
+            try:
+                with contextlib.ExitStack() as stack:
+                    if "memory" in modes:
+                        stack.enter_context(allocations)
+                    if "cpu" in modes:
+                        stack.enter_context(profiler)
+                    await self.app(scope, receive, send_wrapper)
+            finally:
+                elapsed = time.perf_counter() - started
+                await asyncio.to_thread(
+                    self._store,
+                    profile_id,
+                    profiler.folded() if "cpu" in modes else None,
+                    allocations.report if "memory" in modes else None,
+                )
+                logger.info(
+                    "Profiled {method} {path} in {elapsed:.3f}s as {profile_id}",
+                    method=scope["method"],
+                    path=scope["path"],
+                    elapsed=elapsed,
+                    profile_id=profile_id,
+                )
+
+    def _store(self, profile_id: str, folded: str | None, allocations: str | None) -> None:
+        os.makedirs(self.config.OUTPUT_DIR, exist_ok=True)
+        for suffix, content in ((".folded", folded), (".allocations.txt", allocations)):
+            if content is not None:
+                with open(os.path.join(self.config.OUTPUT_DIR, profile_id + suffix), "w", encoding="utf-8") as file:
+                    file.write(content)
@@ -0,0 +1,370 @@
+import asyncio
+import contextlib
+import functools
+import inspect
+import json
+import random
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, TypeVar
+
+import aiohttp
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql.util import find_tables
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import settings
+from app.core.config.tracing import TracingConfig
+
+__all__ = [
+    "Span",
+    "SpanKind",
+    "Tracer",
+    "tracer",
+    "traced",
+    "instrument_engine",
+    "TracingMiddleware",
+    "export_spans",
+]
+
+C = TypeVar("C", bound=type)
+
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+class SpanKind(IntEnum):
+    """OTLP span kinds."""
+
+    internal = 1
+    server = 2
+    client = 3
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    kind: SpanKind
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def to_otlp(self) -> dict[str, Any]:
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Tracer:
+    """
+    Collects spans of sampled requests into a bounded in-memory buffer, exported in batches by `export_spans`.
+    Spans are only recorded inside a request trace started by `TracingMiddleware`.
+    """
+
+    def __init__(self, config: TracingConfig) -> None:
+        self.config = config
+        self.enabled = config.ENABLED
+        self._buffer: deque[Span] = deque(maxlen=config.BUFFER_SIZE)
+
+    def start_trace(self, name: str, traceparent: str | None = None) -> Span | None:
+        """Root span of a request, or None when the request is not sampled."""
+        trace_id = parent_id = None
+        if traceparent and (match := TRACEPARENT_PATTERN.match(traceparent.strip().lower())):
+            trace_id, parent_id, flags = match.groups()
+            if not int(flags, 16) & 1:
+                return None
+        elif random.random() >= self.config.SAMPLE_RATE:
+            return None
+
+        return Span(
+            name=name,
+            kind=SpanKind.server,
+            trace_id=trace_id or f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            start_ns=time.time_ns(),
+        )
+
+    def start_span(self, name: str, kind: SpanKind = SpanKind.internal, **attributes: Any) -> Span | None:
+        parent = _current_span.get()
+        if parent is None:
+            return None
+
+        return Span(
+            name=name,
+            kind=kind,
+            trace_id=parent.trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+
+    def end_span(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        self._buffer.append(span)
+
+    @contextlib.contextmanager
+    def span(self, name: str, kind: SpanKind = SpanKind.internal, **attributes: Any) -> Iterator[Span | None]:
+        span = self.start_span(name, kind, **attributes)
+        if span is None:
+            yield None
+            return
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = repr(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def drain(self) -> list[Span]:
+        spans = list(self._buffer)
+        self._buffer.clear()
+        return spans
+
+    def to_otlp(self, spans: list[Span]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", self.config.SERVICE_NAME)]},
+                    "scopeSpans": [{"scope": {"name": "app"}, "spans": [span.to_otlp() for span in spans]}],
+                }
+            ]
+        }
+
+
+tracer = Tracer(settings.tracing)
+
+
+def traced(kind: SpanKind = SpanKind.internal) -> Callable[[C], C]:
+    """
+    Class decorator wrapping every public coroutine method of the class in a span named `Class.method`.
+    Static methods are traced under the decorated class; instance methods under the class of the instance,
+    so methods inherited from a mixin are reported under the concrete repository.
+    Leaves the class untouched when tracing is disabled.
+    """
+
+    def decorator(cls: C) -> C:
+        if not tracer.enabled:
+            return cls
+
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_"):
+                continue
+            if isinstance(value, staticmethod) and inspect.iscoroutinefunction(value.__func__):
+                setattr(cls, attr, staticmethod(_trace_function(value.__func__, f"{cls.__name__}.{attr}", kind)))
+            elif inspect.iscoroutinefunction(value):
+                setattr(cls, attr, _trace_method(value, attr, kind))
+        return cls
+
+    return decorator
+
+
+def _trace_function(func: Callable[..., Any], name: str, kind: SpanKind) -> Callable[..., Any]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with tracer.span(name, kind):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def _trace_method(func: Callable[..., Any], name: str, kind: SpanKind) -> Callable[..., Any]:
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        model = getattr(self, "model", None)
+        attributes = {"db.table": model.__tablename__} if model is not None else {}
+        with tracer.span(f"{type(self).__name__}.{name}", kind, **attributes):
+            return await func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _statement_tables(context: ExecutionContext) -> str:
+    statement = getattr(getattr(context, "compiled", None), "statement", None)
+    if statement is None:
+        return ""
+    table = getattr(statement, "table", None)
+    if table is not None:
+        return table.name
+    froms = statement.get_final_froms() if hasattr(statement, "get_final_froms") else []
+    return ",".join(sorted({table.name for from_ in froms for table in find_tables(from_)}))
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+) -> None:
+    span = tracer.start_span(
+        "sql",
+        SpanKind.client,
+        **{
+            "db.system": "postgresql",
+            "db.operation": statement.split(None, 1)[0].upper() if statement else "",
+            "db.table": _statement_tables(context),
+            "db.statement": statement[: tracer.config.MAX_STATEMENT_LENGTH],
+        },
+    )
+    if span is not None:
+        span.name = f"SQL {span.attributes['db.operation']} {span.attributes['db.table']}".strip()
+        context._trace_span = span  # type: ignore[attr-defined]
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+) -> None:
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        span.attributes["db.rows"] = cursor.rowcount
+        tracer.end_span(span)
+
+
+def _handle_error(exception_context: ExceptionContext) -> None:
+    span = getattr(exception_context.execution_context, "_trace_span", None)
+    if span is not None:
+        span.error = repr(exception_context.original_exception)
+        tracer.end_span(span)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Adds a span per SQL statement executed by the engine, as a child of the current span."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+class TracingMiddleware:
+    """Starts the root span of every sampled request, named after the matched route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        span = tracer.start_trace(
+            f"{scope['method']} {scope['path']}",
+            traceparent=Headers(scope=scope).get("traceparent"),
+        )
+        if span is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.attributes["http.status_code"] = message["status"]
+            await send(message)
+
+        span.attributes["http.method"] = scope["method"]
+        token = _current_span.set(span)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            span.error = repr(exc)
+            span.attributes.setdefault("http.status_code", 500)
+            raise
+        finally:
+            _current_span.reset(token)
+            if route := scope.get("route"):
+                span.name = f"{scope['method']} {route.path}"
+                span.attributes["http.route"] = route.path
+            tracer.end_span(span)
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    async def export(self, payload: dict[str, Any]) -> None:
+        pass
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends one OTLP/JSON export request per line, the format of the OpenTelemetry collector file exporter."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def _write(self, line: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+    async def export(self, payload: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, json.dumps(payload))
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """Posts OTLP/JSON export requests to a collector's `/v1/traces` endpoint."""
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+
+    async def export(self, payload: dict[str, Any]) -> None:
+        async with aiohttp.ClientSession() as session:
+            async with session.post(self.endpoint, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+
+
+def _create_exporter(config: TracingConfig) -> SpanExporter:
+    if config.EXPORTER == "otlp":
+        return OTLPHttpSpanExporter(config.OTLP_ENDPOINT)
+    return FileSpanExporter(config.FILE_PATH)
+
+
+async def _flush(exporter: SpanExporter) -> None:
+    spans = tracer.drain()
+    if not spans:
+        return
+    try:
+        await exporter.export(tracer.to_otlp(spans))
+    except Exception:
+        logger.exception("Failed to export {count} spans", count=len(spans))
+
+
+async def export_spans() -> None:
+    """Background loop exporting the buffered spans, started with the application when tracing is enabled."""
+    exporter = _create_exporter(tracer.config)
+    try:
+        while True:
+            await asyncio.sleep(tracer.config.FLUSH_INTERVAL_SECONDS)
+            await _flush(exporter)
+    finally:
+        await asyncio.shield(_flush(exporter))
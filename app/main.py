@@ -1,21 +1,51 @@
+import asyncio
+import contextlib
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+from app.api.admission import AdmissionControlMiddleware
 from app.api.routers import main_router
 from app.core import settings
+from app.core.logger import configure_logging
+from app.infra.change_feed import change_feed_listener
+from app.infra.database import dispose_engines
+from app.infra.loop_monitor import loop_monitor
+from app.infra.profiling import ProfilingMiddleware
+from app.infra.tracing import TracingMiddleware, export_spans, tracer
+from app.services.idempotency import expire_idempotency_keys
+from app.services.warmup import warm_up_database
 from loguru import logger
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     logger.info("Starting app...")
+    _app.state.ready = False
+    if settings.loop_monitor.ENABLED:
+        loop_monitor.start()
+    await warm_up_database()
+    idempotency_cleanup = asyncio.create_task(expire_idempotency_keys())
+    span_export = asyncio.create_task(export_spans()) if tracer.enabled else None
+    _app.state.ready = True
 
     yield
 
+    idempotency_cleanup.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await idempotency_cleanup
+    await change_feed_listener.close()
+    await dispose_engines()
+    await loop_monitor.stop()
+    if span_export:
+        span_export.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await span_export
     logger.info("Application stopped.")
+    await logger.complete()
 
 
 def _include_router(app: FastAPI) -> None:
@@ -23,6 +53,9 @@ def _include_router(app: FastAPI) -> None:
 
 
 def _add_middleware(app: FastAPI) -> None:
+    if settings.profiling.ENABLED and not settings.is_production:
+        app.add_middleware(ProfilingMiddleware, config=settings.profiling)
+    app.add_middleware(AdmissionControlMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.ALLOW_ORIGINS if settings.ALLOW_ORIGINS else ["*"],
@@ -30,6 +63,8 @@ def _add_middleware(app: FastAPI) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if tracer.enabled:
+        app.add_middleware(TracingMiddleware)
 
 
 def _create_production_app() -> FastAPI:
@@ -52,6 +87,7 @@ def _create_development_app() -> FastAPI:
 
 
 def create_app() -> FastAPI:
+    configure_logging()
     app_factory = _create_production_app if settings.is_production else _create_development_app
     app = app_factory()
 
@@ -68,4 +104,9 @@ if __name__ == "__main__":
         port=settings.SERVER_PORT,
         reload=settings.RELOAD,
         factory=True,
+        workers=settings.WORKERS,
+        loop=settings.LOOP,
+        http=settings.HTTP,
+        limit_max_requests=settings.LIMIT_MAX_REQUESTS,
+        timeout_graceful_shutdown=settings.TIMEOUT_GRACEFUL_SHUTDOWN,
     )
@@ -1,3 +1,4 @@
 from app.models.cat import *
 from app.models.mission import *
 from app.models.target import *
+from app.models.idempotency import *
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, String, Float, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, UUIDMixin, TimestampMixin
@@ -6,6 +6,9 @@ from app.models.base import Base, UUIDMixin, TimestampMixin
 
 class SpyCat(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "spy_cats"
+    __table_args__ = (
+        Index("ix_spy_cats_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     name = Column(String, index=True)
     years_of_experience = Column(Integer, index=True)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.dialects import postgresql
+
+from app.models.base import Base, CreatedAtMixin
+
+
+class IdempotencyKey(Base, CreatedAtMixin):
+    __tablename__ = "idempotency_keys"
+
+    scope = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+    request_hash = Column(String, nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(postgresql.JSONB, nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
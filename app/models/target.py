@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Boolean, String, UUID
+from sqlalchemy import Column, ForeignKey, Boolean, String, UUID, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, UUIDMixin, TimestampMixin
@@ -6,6 +6,12 @@ from app.models.base import Base, UUIDMixin, TimestampMixin
 
 class Target(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "targets"
+    __table_args__ = (
+        Index("ix_targets_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_targets_country_trgm", "country", postgresql_using="gin", postgresql_ops={"country": "gin_trgm_ops"}),
+        Index("ix_targets_notes_trgm", "notes", postgresql_using="gin", postgresql_ops={"notes": "gin_trgm_ops"}),
+        Index("ix_targets_mission_id_created_at_id", "mission_id", "created_at", "id"),
+    )
 
     mission_id = Column(UUID, ForeignKey("missions.id"), index=True)
     name = Column(String, index=True)
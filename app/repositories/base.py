@@ -1,18 +1,32 @@
+import functools
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import TypeVar, Generic, Any, overload, Literal
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import TypeVar, Generic, Any, overload, Literal, cast
+from uuid import UUID
 
 
 from pydantic import BaseModel
-from sqlalchemy import select, and_, ColumnElement, func, delete, desc, asc, update
+from sqlalchemy import select, and_, or_, ColumnElement, func, delete, desc, asc, update, tuple_, any_, bindparam, Uuid
+from sqlalchemy import ClauseElement, CursorResult, Row, Select, Table, all_
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute, DeclarativeMeta
-
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.constants.base import (
+    BULK_READ_BATCH_ROWS,
+    BULK_WRITE_CHUNK_ROWS,
+    SEARCH_MAX_MATCHES,
+    STATEMENT_CACHE_SIZE,
+)
 from app.core.exceptions import ObjectAlreadyExistsException, ObjectNotFoundException
+from app.infra.tracing import traced
+from app.models.base import Base
+from app.utils.utils import chunked, escape_like
 
-T = TypeVar("T", bound=DeclarativeMeta)
+T = TypeVar("T", bound=Base)
 S = TypeVar("S", bound=BaseModel)
 
 action_map = {
@@ -26,9 +40,125 @@ action_map = {
     "in": "in_",
     "not_in": "notin_",
     "ilike": "ilike",
+    "is": "is_",
     "is_not": "is_not",
 }
 
+EXPANDING_ACTIONS = frozenset({"in", "not_in"})
+# IS takes no bind parameter, so their values are part of the statement
+INLINE_ACTIONS = frozenset({"is", "is_not"})
+
+# Marks a filter value that is passed as a bind parameter of a statement template
+_BOUND = object()
+
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _filter_spec(model: type[Base], keys: tuple[str, ...]) -> tuple[tuple[InstrumentedAttribute, str, str], ...]:
+    """Column, comparison method and action of every `column__action` filter key, parsed once per model and keys."""
+    spec = []
+    for key in keys:
+        if "__" not in key:
+            key = f"{key}__eq"
+        column_name, action_name = key.split("__")
+        column: InstrumentedAttribute = getattr(model, column_name)
+        if column is None:
+            raise Exception(f"Column {column_name} not found in {model.__name__}")
+        action: str | None = action_map.get(action_name, None)
+        if action is None:
+            raise Exception(f"Action {action_name} not found in action_map")
+        spec.append((column, action, action_name))
+    return tuple(spec)
+
+
+def _filter_shape(filters: dict[str, Any]) -> tuple[tuple[str, Any], ...] | None:
+    """
+    Hashable description of the SQL the filters render to: the keys, plus the values rendered inline (None and
+    the values of IS comparisons). None when a value can't be bound, e.g. a SQL expression.
+    """
+    shape: list[tuple[str, Any]] = []
+    for key, value in filters.items():
+        action_name = key.partition("__")[2] or "eq"
+        if value is None or action_name in INLINE_ACTIONS:
+            if not isinstance(value, bool | None):
+                return None
+            shape.append((key, value))
+        elif isinstance(value, ClauseElement) or (
+            action_name in EXPANDING_ACTIONS and not isinstance(value, list | tuple | set | frozenset)
+        ):
+            return None
+        else:
+            shape.append((key, _BOUND))
+    return tuple(shape)
+
+
+def _build_statement(model: type[Any], kind: tuple[Any, ...], where: Sequence[ColumnElement]) -> Select:
+    if kind[0] == "count":
+        return select(func.count()).select_from(model).where(*where)
+    if kind[0] == "fields":
+        return select(*(getattr(model, field) for field in kind[1])).where(*where)
+    statement: Select[Any]
+    if kind[0] == "page":
+        statement = (
+            select(model, func.count().over().label("total_count"))
+            .where(*where)
+            .offset(bindparam("offset"))
+            .limit(bindparam("limit"))
+        )
+        return _order_by(statement, model, kind[1]) if kind[1] else statement.order_by(model.id)
+    if kind[0] == "cursor":
+        statement = select(model).where(*where)
+        if kind[1]:
+            after = tuple_(
+                bindparam("after_created_at", type_=model.created_at.type),
+                bindparam("after_id", type_=model.id.type),
+            )
+            statement = statement.where(tuple_(model.created_at, model.id) > after)
+        return statement.order_by(model.created_at, model.id).limit(bindparam("limit"))
+    return select(model).where(*where)
+
+
+def _order_by(statement: Select, model: type[Any], order_by: str | None) -> Select:
+    """Orders by the requested column, then by id, so that rows with equal values keep a stable order across pages."""
+    if order_by:
+        if order_by.startswith("-"):
+            statement = statement.order_by(desc(getattr(model, order_by[1:])).nulls_last())
+        else:
+            statement = statement.order_by(asc(getattr(model, order_by)))
+        statement = statement.order_by(model.id)
+    return statement
+
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _statement_template(
+    model: type[Base], kind: tuple[Any, ...], shape: tuple[tuple[str, Any], ...], arrays: bool = False
+) -> tuple[Select, tuple[str | None, ...]]:
+    """
+    Statement of the given kind filtered by bind parameters, and the parameter name of every filter value.
+    Reusing the same statement object lets SQLAlchemy skip rebuilding it and reuse its memoized cache key,
+    so the compiled SQL is found in the engine's cache without walking the statement again.
+    With `arrays`, IN filters bind their list as one array (`= ANY(:list)`), so the SQL doesn't depend on its length.
+    """
+    spec = _filter_spec(model, tuple(key for key, _ in shape))
+
+    where: list[ColumnElement] = []
+    names: list[str | None] = []
+    for index, ((column, action, action_name), (_, value)) in enumerate(zip(spec, shape)):
+        if value is not _BOUND:
+            where.append(getattr(column, action)(value))
+            names.append(None)
+            continue
+
+        name = f"filter_{index}"
+        if arrays and action_name in EXPANDING_ACTIONS:
+            parameter = bindparam(name, type_=ARRAY(column.type))
+            where.append(column == any_(parameter) if action_name == "in" else column != all_(parameter))
+        else:
+            parameter = bindparam(name, type_=column.type, expanding=action_name in EXPANDING_ACTIONS)
+            where.append(getattr(column, action)(parameter))
+        names.append(name)
+
+    return _build_statement(model, kind, where), tuple(names)
+
 
 class AbstractRepositoryMixin(ABC, Generic[T, S]):
     model: type[T]
@@ -50,7 +180,7 @@ class AbstractRepositoryMixin(ABC, Generic[T, S]):
         pass
 
     @abstractmethod
-    async def create_many(self, obj_in: list[dict[str, Any]]) -> None:
+    async def create_many(self, obj_in: Iterable[dict[str, Any]]) -> None:
         pass
 
     @overload
@@ -108,6 +238,30 @@ class AbstractRepositoryMixin(ABC, Generic[T, S]):
     ) -> Sequence[T] | list[S]:
         pass
 
+    @overload
+    @abstractmethod
+    async def get_multi(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        return_scheme: Literal[True] = ...,
+        options: list[Any] | None = None,
+        **filters: Any,
+    ) -> tuple[list[S], int]: ...
+
+    @overload
+    @abstractmethod
+    async def get_multi(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        return_scheme: Literal[False] = ...,
+        options: list[Any] | None = None,
+        **filters: Any,
+    ) -> tuple[Sequence[T], int]: ...
+
     @abstractmethod
     async def get_multi(
         self,
@@ -197,7 +351,10 @@ class AbstractRepositoryMixin(ABC, Generic[T, S]):
         pass
 
 
+@traced()
 class RepositoryMixin(AbstractRepositoryMixin[T, S]):
+    search_fields: tuple[str, ...] = ()
+
     def _convert(self, db_obj: T) -> S:
         return self.schema.model_validate(db_obj)
 
@@ -236,22 +393,28 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         await self._session.execute(statement)
         await self._session.flush()
 
-    async def create_many(self, obj_in: list[dict[str, Any]]) -> None:
-        try:
-            statement = pg_insert(self.model).values(obj_in)
-            statement = statement.on_conflict_do_nothing()
-            await self._session.execute(statement)
-            await self._session.flush()
-        except IntegrityError:
-            raise ObjectAlreadyExistsException(obj_in, self.model.__name__)
+    async def create_many(self, obj_in: Iterable[dict[str, Any]]) -> None:
+        """
+        Inserts the rows `BULK_WRITE_CHUNK_ROWS` at a time, so a large iterable isn't materialized at once.
+        Each chunk is one executemany of a single compiled statement, which SQLAlchemy's insertmanyvalues
+        turns into multi-row INSERTs within the bind parameter limit. Rows conflicting with existing ones are skipped.
+        """
+        statement = pg_insert(self.model).on_conflict_do_nothing()
+        for chunk in chunked(obj_in, BULK_WRITE_CHUNK_ROWS):
+            try:
+                await self._session.execute(statement, chunk)
+                await self._session.flush()
+            except IntegrityError:
+                raise ObjectAlreadyExistsException(chunk, self.model.__name__)
 
     async def create_many_or_update(
         self,
-        obj_in: list[dict[str, Any]],
+        obj_in: Iterable[dict[str, Any]],
         conflict_columns: list[str],
         update_columns: list[str],
     ) -> list[T]:
-        statement = pg_insert(self.model).values(obj_in)
+        """Inserts or updates the rows chunk by chunk like `create_many`, returning the resulting objects."""
+        statement = pg_insert(self.model)
 
         update_dict = {col: getattr(statement.excluded, col) for col in update_columns}
 
@@ -259,12 +422,14 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
             self.model
         )
 
-        result = await self._session.execute(statement)
-        objs = result.scalars().all()
+        objs: list[T] = []
+        for chunk in chunked(obj_in, BULK_WRITE_CHUNK_ROWS):
+            result = await self._session.execute(statement, chunk, execution_options={"populate_existing": True})
+            objs.extend(result.scalars().all())
 
-        await self._session.flush()
+            await self._session.flush()
 
-        return list(objs)
+        return objs
 
     @overload
     async def get(
@@ -288,11 +453,11 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         options: list[Any] | None = None,
         return_scheme: bool = False,
     ) -> T | S:
-        query = select(self.model).where(and_(*[getattr(self.model, k) == v for k, v in filters.items()]))
+        query, params = self._filtered_statement(("select",), filters)
         if options:
             query = query.options(*options)
 
-        result = await self._session.execute(query)
+        result = await self._session.execute(query, params)
         obj = result.scalars().first()
 
         if obj is None:
@@ -303,12 +468,78 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
 
         return obj
 
+    @overload
+    async def get_many_by_ids(
+        self,
+        ids: Sequence[UUID],
+        options: list[Any] | None = None,
+        return_scheme: Literal[True] = ...,
+    ) -> tuple[list[S], list[UUID]]: ...
+
+    @overload
+    async def get_many_by_ids(
+        self,
+        ids: Sequence[UUID],
+        options: list[Any] | None = None,
+        return_scheme: Literal[False] = ...,
+    ) -> tuple[list[T], list[UUID]]: ...
+
+    async def get_many_by_ids(
+        self,
+        ids: Sequence[UUID],
+        options: list[Any] | None = None,
+        return_scheme: bool = False,
+    ) -> tuple[list[T] | list[S], list[UUID]]:
+        """
+        Fetches objects by id with a single `id = ANY(:ids)` query.
+        Returns the found objects in the order of `ids` (without duplicates) and the ids that were not found.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+
+        id_column = self.model.id  # type: ignore[attr-defined]
+        statement = select(self.model).where(id_column == any_(bindparam("ids", unique_ids, type_=ARRAY(Uuid))))
+        if options:
+            statement = statement.options(*options)
+
+        result = await self._session.execute(statement)
+        objs_by_id = {obj.id: obj for obj in result.scalars().all()}  # type: ignore[attr-defined]
+
+        objs = [objs_by_id[_id] for _id in unique_ids if _id in objs_by_id]
+        missing_ids = [_id for _id in unique_ids if _id not in objs_by_id]
+
+        if return_scheme:
+            return self._convert_list(objs=objs), missing_ids
+
+        return objs, missing_ids
+
     async def get_one_or_none(self, filters: dict[str, Any]) -> T | None:
-        query = select(self.model).where(and_(*[getattr(self.model, k) == v for k, v in filters.items()]))
-        result = await self._session.execute(query)
+        query, params = self._filtered_statement(("select",), filters)
+        result = await self._session.execute(query, params)
         obj = result.scalars().first()
         return obj
 
+    @overload
+    async def get_multi(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        return_scheme: Literal[True] = ...,
+        options: list[Any] | None = None,
+        **filters: Any,
+    ) -> tuple[list[S], int]: ...
+
+    @overload
+    async def get_multi(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        return_scheme: Literal[False] = ...,
+        options: list[Any] | None = None,
+        **filters: Any,
+    ) -> tuple[Sequence[T], int]: ...
+
     async def get_multi(
         self,
         offset: int = 0,
@@ -318,22 +549,113 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         options: list[Any] | None = None,
         **filters: Any,
     ) -> tuple[Sequence[T] | list[S], int]:
+        statement, params = self._filtered_statement(("page", order_by), filters)
+
+        if options:
+            statement = statement.options(*options)
+
+        result = await self._session.execute(statement, {**params, "offset": offset, "limit": limit})
+        rows = result.all()
+
+        if rows:
+            objs = [row[0] for row in rows]
+            total_count = rows[0][1]
+        else:
+            objs = []
+            total_count = 0
+
+        if return_scheme:
+            objs = self._convert_list(objs=objs)
+
+        return objs, total_count
+
+    @overload
+    async def get_multi_by_cursor(
+        self,
+        limit: int = 10,
+        after: tuple[datetime, UUID] | None = None,
+        return_scheme: Literal[True] = ...,
+        **filters: Any,
+    ) -> tuple[list[S], tuple[datetime, UUID] | None]: ...
+
+    @overload
+    async def get_multi_by_cursor(
+        self,
+        limit: int = 10,
+        after: tuple[datetime, UUID] | None = None,
+        return_scheme: Literal[False] = ...,
+        **filters: Any,
+    ) -> tuple[Sequence[T], tuple[datetime, UUID] | None]: ...
+
+    async def get_multi_by_cursor(
+        self,
+        limit: int = 10,
+        after: tuple[datetime, UUID] | None = None,
+        return_scheme: bool = False,
+        **filters: Any,
+    ) -> tuple[Sequence[T] | list[S], tuple[datetime, UUID] | None]:
+        """
+        Keyset pagination ordered by (created_at, id).
+        Returns the page and the position of its last item, or None when there are no more items.
+        """
+        statement, params = self._filtered_statement(("cursor", after is not None), filters)
+        params["limit"] = limit + 1
+
+        if after is not None:
+            params["after_created_at"], params["after_id"] = after
+
+        result = await self._session.execute(statement, params)
+        objs = result.scalars().all()
+
+        next_position = None
+        if len(objs) > limit:
+            objs = objs[:limit]
+            last = objs[-1]
+            next_position = (last.created_at, last.id)  # type: ignore[attr-defined]
+
+        if return_scheme:
+            return self._convert_list(objs=objs), next_position
+
+        return objs, next_position
+
+    async def search(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 10,
+        return_scheme: bool = False,
+        **filters: Any,
+    ) -> tuple[Sequence[T] | list[S], int, bool]:
+        """
+        Substring search over `search_fields`, ranked by trigram word similarity.
+
+        `ILIKE '%query%'` is served by the pg_trgm GIN indexes on those columns, but ranking needs the similarity
+        of every match, so only the first `SEARCH_MAX_MATCHES` matches the index returns are ranked and counted.
+        A broad query therefore costs the same as a query with that many matches, at the price of its best
+        matches possibly lying outside the ranked set and of an inexact count.
+
+        Returns the page, the number of matches capped at `SEARCH_MAX_MATCHES`, and whether there are more.
+        """
+        columns = [getattr(self.model, field) for field in self.search_fields]
+        pattern = f"%{escape_like(query)}%"
+        rank = func.greatest(*[func.word_similarity(query, column) for column in columns])
+        id_column = self.model.id  # type: ignore[attr-defined]
+
+        # one more than the cap, to tell a capped count from an exact one
+        matches = (
+            select(id_column)
+            .where(or_(*[column.ilike(pattern) for column in columns]), *self.get_where_clauses(filters))
+            .limit(SEARCH_MAX_MATCHES + 1)
+            .subquery()
+        )
         statement = (
             select(self.model, func.count().over().label("total_count"))
-            .where(*self.get_where_clauses(filters))
+            .join(matches, matches.c.id == id_column)
+            .order_by(rank.desc(), id_column)
             .offset(offset)
             .limit(limit)
         )
 
-        if options:
-            statement = statement.options(*options)
-
-        if order_by:
-            if order_by.startswith("-"):
-                statement = statement.order_by(desc(getattr(self.model, order_by[1:])).nulls_last())
-            else:
-                statement = statement.order_by(asc(getattr(self.model, order_by)))
-
         result = await self._session.execute(statement)
         rows = result.all()
 
@@ -347,7 +669,7 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         if return_scheme:
             objs = self._convert_list(objs=objs)
 
-        return objs, total_count
+        return objs, min(total_count, SEARCH_MAX_MATCHES), total_count > SEARCH_MAX_MATCHES
 
     @overload
     async def get_multi_without_pagination(
@@ -368,13 +690,7 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
     async def get_multi_without_pagination(
         self, order_by: str | None = None, return_scheme: bool = False, **filters: Any
     ) -> Sequence[T] | list[S]:
-        statement = select(self.model).where(*self.get_where_clauses(filters))
-
-        if order_by:
-            if order_by.startswith("-"):
-                statement = statement.order_by(desc(getattr(self.model, order_by[1:])).nulls_last())
-            else:
-                statement = statement.order_by(asc(getattr(self.model, order_by)))
+        statement = self._select_without_pagination(order_by=order_by, filters=filters)
 
         result = await self._session.execute(statement)
         objs = result.scalars().all()
@@ -384,21 +700,51 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
 
         return objs
 
+    async def iter_multi_without_pagination(
+        self,
+        order_by: str | None = None,
+        batch_size: int = BULK_READ_BATCH_ROWS,
+        return_scheme: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator[Sequence[T] | list[S]]:
+        """
+        Streams what `get_multi_without_pagination` returns in batches of `batch_size`, through a server-side cursor.
+        Each batch is expunged from the session when the next one is requested, so memory stays bounded by the
+        batch size; objects of earlier batches are detached and can't lazy-load or be flushed anymore.
+        """
+        statement = self._select_without_pagination(order_by=order_by, filters=filters)
+
+        result = await self._session.stream(statement.execution_options(yield_per=batch_size))
+        try:
+            async for objs in result.scalars().partitions(batch_size):
+                yield self._convert_list(objs) if return_scheme else objs
+
+                for obj in objs:
+                    self._session.expunge(obj)
+        finally:
+            await result.close()
+
+    def _select_without_pagination(self, order_by: str | None, filters: dict[str, Any]) -> Select:
+        statement = select(self.model).where(*self.get_where_clauses(filters))
+        return _order_by(statement, self.model, order_by)
+
     def get_where_clauses(self, filters: dict[str, Any]) -> list[ColumnElement]:
-        clauses: list[ColumnElement] = []
-        for key, value in filters.items():
-            if "__" not in key:
-                key = f"{key}__eq"
-            column_name, action_name = key.split("__")
-            column: InstrumentedAttribute = getattr(self.model, column_name)
-            if column is None:
-                raise Exception(f"Column {column_name} not found in {self.model.__name__}")
-            action: str | None = action_map.get(action_name, None)
-            if action is None:
-                raise Exception(f"Action {action_name} not found in action_map")
-            clause: ColumnElement = getattr(column, action)(value)
-            clauses.append(clause)
-        return clauses
+        spec = _filter_spec(self.model, tuple(filters))
+        return [getattr(column, action)(value) for (column, action, _), value in zip(spec, filters.values())]
+
+    def _filtered_statement(self, kind: tuple[Any, ...], filters: dict[str, Any]) -> tuple[Select, dict[str, Any]]:
+        """
+        Cached statement template of the given kind for the shape of `filters`, with the parameters to execute it.
+        Filters that can't be bound fall back to a statement built for this call.
+        """
+        shape = _filter_shape(filters)
+        if shape is None:
+            statement = _build_statement(self.model, kind, self.get_where_clauses(filters))
+            return statement, {}
+
+        statement, names = _statement_template(self.model, kind, shape)
+        params = {name: value for name, value in zip(names, filters.values()) if name is not None}
+        return statement, params
 
     @overload
     async def update(
@@ -422,8 +768,8 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         updates: dict[str, Any],
         return_scheme: bool = False,
     ) -> T | S:
-        query = select(self.model).where(and_(*[getattr(self.model, k) == v for k, v in filters.items()]))
-        result = await self._session.execute(query)
+        query, params = self._filtered_statement(("select",), filters)
+        result = await self._session.execute(query, params)
         obj = result.scalars().first()
         if not obj:
             raise ObjectNotFoundException(filters, self.model.__name__)
@@ -464,10 +810,17 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         updates: dict[str, Any],
         return_scheme: bool = False,
     ) -> Sequence[T] | list[S]:
-        stmt = update(self.model).where(and_(*self.get_where_clauses(filters))).values(**updates).returning(self.model)
-
-        result = await self._session.execute(stmt)
-        objs = result.scalars().all()
+        objs: list[T] = []
+        for chunk_filters in self._chunk_filters(filters):
+            stmt = (
+                update(self.model)
+                .where(and_(*self.get_where_clauses(chunk_filters)))
+                .values(**updates)
+                .returning(self.model)
+            )
+
+            result = await self._session.execute(stmt)
+            objs.extend(result.scalars().all())
 
         await self._session.flush()
 
@@ -476,9 +829,65 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
 
         return objs
 
+    async def iter_update_many(
+        self,
+        filters: dict[str, Any],
+        updates: dict[str, Any],
+        batch_size: int = BULK_READ_BATCH_ROWS,
+        return_scheme: bool = False,
+    ) -> AsyncIterator[list[Row] | list[S]]:
+        """
+        Streaming variant of `update_many`: the UPDATE ... RETURNING runs against the table, not the ORM entity,
+        and the updated rows are yielded in batches of `batch_size` as plain rows or schemas.
+        Nothing is added to the identity map, so objects of these rows already loaded in the session are stale.
+        """
+        table = cast(Table, self.model.__table__)
+        for chunk_filters in self._chunk_filters(filters):
+            stmt = (
+                update(table)
+                .where(and_(*self.get_where_clauses(chunk_filters)))
+                .values(**updates)
+                .returning(*table.columns)
+            )
+
+            result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+            try:
+                async for rows in result.partitions(batch_size):
+                    if return_scheme:
+                        yield [self.schema.model_validate(row) for row in rows]
+                    else:
+                        yield list(rows)
+            finally:
+                await result.close()
+
+    async def update_many_count(self, filters: dict[str, Any], updates: dict[str, Any]) -> int:
+        """`update_many` without RETURNING, for callers that only need the number of updated rows."""
+        count = 0
+        for chunk_filters in self._chunk_filters(filters):
+            stmt = update(self.model).where(and_(*self.get_where_clauses(chunk_filters))).values(**updates)
+
+            result = cast(CursorResult[Any], await self._session.execute(stmt))
+            count += result.rowcount
+
+        await self._session.flush()
+
+        return count
+
+    @staticmethod
+    def _chunk_filters(filters: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Splits the largest `__in` filter into chunks, so that a statement never binds too many parameters."""
+        in_keys = [key for key, value in filters.items() if key.endswith("__in") and isinstance(value, list | tuple)]
+        largest = max(in_keys, key=lambda key: len(filters[key]), default=None)
+        if largest is None or len(filters[largest]) <= BULK_WRITE_CHUNK_ROWS:
+            yield filters
+            return
+
+        for chunk in chunked(filters[largest], BULK_WRITE_CHUNK_ROWS):
+            yield {**filters, largest: chunk}
+
     async def delete(self, filters: dict[str, Any]) -> None:
-        query = select(self.model).where(and_(*[getattr(self.model, k) == v for k, v in filters.items()]))
-        result = await self._session.execute(query)
+        query, params = self._filtered_statement(("select",), filters)
+        result = await self._session.execute(query, params)
         obj = result.scalars().first()
         if not obj:
             raise ObjectNotFoundException(filters, self.model.__name__)
@@ -518,8 +927,8 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         return obj_dict
 
     async def count(self, filters: dict[str, Any]) -> int:
-        statement = select(func.count()).where(and_(*self.get_where_clauses(filters)))
-        result = await self._session.execute(statement)
+        statement, params = self._filtered_statement(("count",), filters)
+        result = await self._session.execute(statement, params)
         count = result.scalar()
         return count
 
@@ -528,10 +937,9 @@ class RepositoryMixin(AbstractRepositoryMixin[T, S]):
         filters: dict[str, Any],
         fields: list[str],
     ) -> dict[str, Any]:
-        columns = [getattr(self.model, field) for field in fields]
-        query = select(*columns).where(and_(*[getattr(self.model, k) == v for k, v in filters.items()]))
+        query, params = self._filtered_statement(("fields", tuple(fields)), filters)
 
-        result = await self._session.execute(query)
+        result = await self._session.execute(query, params)
         row = result.first()
 
         if row is None:
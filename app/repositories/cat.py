@@ -1,7 +1,10 @@
 from app import models, schemas
+from app.infra.tracing import traced
 from app.repositories.base import RepositoryMixin
 
 
+@traced()
 class CatRepository(RepositoryMixin[models.SpyCat, schemas.Cat]):
     model = models.SpyCat
     schema = schemas.Cat
+    search_fields = ("name",)
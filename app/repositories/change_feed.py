@@ -0,0 +1,25 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core.constants.base import MISSION_CHANGES_CHANNEL, NOTIFY_PAYLOAD_LIMIT
+from app.infra.tracing import traced
+
+
+@traced()
+class ChangeFeedRepository:
+    """
+    Publishes change events with NOTIFY inside the current transaction.
+    PostgreSQL delivers them to listeners only after the transaction commits, and drops them on rollback.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def publish(self, event: schemas.MissionChangeEvent) -> None:
+        payload = event.model_dump_json(exclude_none=True)
+
+        if len(payload.encode()) > NOTIFY_PAYLOAD_LIMIT:
+            payload = event.model_copy(update={"target_ids": None}).model_dump_json(exclude_none=True)
+
+        await self._session.execute(select(func.pg_notify(MISSION_CHANGES_CHANNEL, payload)))
@@ -0,0 +1,192 @@
+import functools
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any, Generic, Literal
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models, schemas
+from app.core.constants.base import STATEMENT_CACHE_SIZE
+from app.core.exceptions import ObjectNotFoundException
+from app.infra.tracing import SpanKind, traced, tracer
+from app.models.base import Base
+from app.repositories.base import S, T, _filter_shape, _statement_template
+
+_dialect = PGDialect_asyncpg(paramstyle="numeric_dollar")  # type: ignore[no-untyped-call]
+
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _compiled_template(
+    model: type[Base], kind: tuple[Any, ...], shape: tuple[tuple[str, Any], ...]
+) -> tuple[str, tuple[str | None, ...], tuple[str, ...]]:
+    """
+    SQL of the `RepositoryMixin` statement template, with the names of the filter parameters
+    and the order of the positional parameters.
+    """
+    statement, filter_names = _statement_template(model, kind, shape, arrays=True)
+    compiled = statement.compile(dialect=_dialect)
+    return compiled.string, filter_names, tuple(compiled.positiontup or ())
+
+
+class FastReadRepository(Generic[T, S]):
+    """
+    Opt-in read path for the hottest lookups. It runs the statements of `RepositoryMixin` as plain SQL on the
+    session's asyncpg connection, prepared once per connection by asyncpg's statement cache, and validates the
+    records straight into schemas. ORM loading and the identity map are skipped. The results are the same as
+    the `RepositoryMixin` methods of the same name return with `return_scheme=True`, which is the only
+    value they accept, so either repository can serve a read (see `ABCUnitOfWork.cat_reader`).
+    """
+
+    model: type[T]
+    schema: type[S]
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def _connection(self) -> asyncpg.Connection:
+        # begins the session's transaction, so the request deadline applies to these statements as well
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+
+    async def _fetch(self, kind: tuple[Any, ...], filters: dict[str, Any], **params: Any) -> list[asyncpg.Record]:
+        shape = _filter_shape(filters)
+        if shape is None:
+            raise TypeError(f"Filters of {self.model.__name__} can't be bound as parameters: {list(filters)}")
+
+        sql, filter_names, positions = _compiled_template(self.model, kind, shape)
+        for name, value in zip(filter_names, filters.values()):
+            if name is not None:
+                params[name] = list(value) if isinstance(value, tuple | set | frozenset) else value
+
+        connection = await self._connection()
+        # the engine's SQL spans don't see statements run on the driver connection
+        with tracer.span(
+            f"SQL SELECT {self.model.__tablename__}",
+            SpanKind.client,
+            **{
+                "db.system": "postgresql",
+                "db.operation": "SELECT",
+                "db.table": self.model.__tablename__,
+                "db.statement": sql[: tracer.config.MAX_STATEMENT_LENGTH],
+            },
+        ) as span:
+            records = await connection.fetch(sql, *(params[name] for name in positions))
+            if span is not None:
+                span.attributes["db.rows"] = len(records)
+
+        return records
+
+    def _convert(self, record: asyncpg.Record) -> S:
+        return self.schema.model_validate(dict(record))
+
+    def _convert_list(self, records: Sequence[asyncpg.Record]) -> list[S]:
+        return [self._convert(record) for record in records]
+
+    async def get(self, filters: dict[str, Any], return_scheme: Literal[True] = True) -> S:
+        records = await self._fetch(("select",), filters)
+
+        if not records:
+            raise ObjectNotFoundException(self.model.__name__, filters)
+
+        return self._convert(records[0])
+
+    async def get_fields(self, filters: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+        records = await self._fetch(("fields", tuple(fields)), filters)
+
+        if not records:
+            raise ObjectNotFoundException(self.model.__name__, filters)
+
+        return dict(zip(fields, records[0].values()))
+
+    async def get_multi(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        return_scheme: Literal[True] = True,
+        **filters: Any,
+    ) -> tuple[list[S], int]:
+        records = await self._fetch(("page", order_by), filters, offset=offset, limit=limit)
+
+        total_count = records[0]["total_count"] if records else 0
+
+        return self._convert_list(records), total_count
+
+    async def get_multi_without_pagination(self, return_scheme: Literal[True] = True, **filters: Any) -> list[S]:
+        records = await self._fetch(("select",), filters)
+        return self._convert_list(records)
+
+    async def get_multi_by_cursor(
+        self,
+        limit: int = 10,
+        after: tuple[datetime, UUID] | None = None,
+        return_scheme: Literal[True] = True,
+        **filters: Any,
+    ) -> tuple[list[S], tuple[datetime, UUID] | None]:
+        """Keyset pagination ordered by (created_at, id), like `RepositoryMixin.get_multi_by_cursor`."""
+        params: dict[str, Any] = {"limit": limit + 1}
+        if after is not None:
+            params["after_created_at"], params["after_id"] = after
+
+        records = await self._fetch(("cursor", after is not None), filters, **params)
+
+        next_position = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_position = (records[-1]["created_at"], records[-1]["id"])
+
+        return self._convert_list(records), next_position
+
+
+@traced()
+class FastCatRepository(FastReadRepository[models.SpyCat, schemas.Cat]):
+    model = models.SpyCat
+    schema = schemas.Cat
+
+
+@traced()
+class FastTargetRepository(FastReadRepository[models.Target, schemas.Target]):
+    model = models.Target
+    schema = schemas.Target
+
+
+@traced()
+class FastMissionRepository(FastReadRepository[models.Mission, schemas.Mission]):
+    model = models.Mission
+    schema = schemas.Mission
+
+    async def get_mission_with_targets(self, filters: dict[str, Any]) -> schemas.MissionWithTargets:
+        mission = await self.get(filters=filters)
+
+        # the same query as selectinload(Mission.targets)
+        targets = await FastTargetRepository(session=self._session).get_multi_without_pagination(
+            mission_id__in=[mission.id]
+        )
+
+        return schemas.MissionWithTargets(**mission.model_dump(), targets=targets)
+
+    async def get_multi_with_relations(
+        self,
+        include: Iterable[str] = (),
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        **filters: Any,
+    ) -> tuple[list[schemas.MissionWithRelations], int]:
+        """`MissionRepository.get_multi_with_relations` without relations to include."""
+        if include:
+            raise ValueError(f"Relations can't be included on the fast read path: {list(include)}")
+
+        records = await self._fetch(("page", order_by), filters, offset=offset, limit=limit)
+
+        total_count = records[0]["total_count"] if records else 0
+
+        missions = [
+            schemas.MissionWithRelations.model_validate({**dict(record), "cat": None, "targets": None})
+            for record in records
+        ]
+        return missions, total_count
@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app import models, schemas
+from app.infra.tracing import traced
+from app.repositories.base import RepositoryMixin
+
+
+@traced()
+class IdempotencyRepository(RepositoryMixin[models.IdempotencyKey, schemas.IdempotencyRecord]):
+    model = models.IdempotencyKey
+    schema = schemas.IdempotencyRecord
+
+    async def claim(
+        self,
+        scope: str,
+        key: str,
+        request_hash: str,
+        expires_at: datetime,
+    ) -> schemas.IdempotencyRecord | None:
+        """
+        Reserves the key for the current transaction and returns None, or returns the stored record
+        when the key has already been used. An expired key is free again and is reclaimed in place,
+        even before the cleanup loop has deleted it.
+        A concurrent request with the same key waits here until the first one commits or rolls back.
+        """
+        insert = pg_insert(self.model).values(scope=scope, key=key, request_hash=request_hash, expires_at=expires_at)
+        statement = insert.on_conflict_do_update(
+            index_elements=[self.model.scope, self.model.key],
+            set_={
+                "request_hash": insert.excluded.request_hash,
+                "expires_at": insert.excluded.expires_at,
+                "created_at": func.now(),
+                "status_code": None,
+                "response_body": None,
+            },
+            where=self.model.expires_at < func.now(),
+        ).returning(self.model.key)
+
+        result = await self._session.execute(statement)
+
+        if result.scalar_one_or_none() is not None:
+            return None
+
+        return await self.get(filters={"scope": scope, "key": key}, return_scheme=True)
+
+    async def save_response(self, scope: str, key: str, status_code: int, response_body: dict[str, Any]) -> None:
+        await self.update_many_count(
+            filters={"scope": scope, "key": key},
+            updates={"status_code": status_code, "response_body": response_body},
+        )
@@ -1,11 +1,17 @@
+from collections.abc import Iterable, Sequence
 from typing import Any
+from uuid import UUID
 
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 
 from app import models, schemas
+from app.core.exceptions import ObjectNotFoundException
+from app.infra.tracing import traced
 from app.repositories.base import RepositoryMixin
 
 
+@traced()
 class MissionRepository(RepositoryMixin[models.Mission, schemas.Mission]):
     model = models.Mission
     schema = schemas.Mission
@@ -19,5 +25,108 @@ class MissionRepository(RepositoryMixin[models.Mission, schemas.Mission]):
 
         return self._convert_with_targets(db_mission=db_mission)
 
+    async def get_mission_with_target_counts(self, filters: dict[str, Any]) -> schemas.MissionWithTargetCounts:
+        statement = (
+            select(
+                self.model,
+                func.count(models.Target.id).label("targets_count"),
+                func.count(models.Target.id).filter(models.Target.complete.is_(True)).label("completed_targets_count"),
+            )
+            .outerjoin(models.Target, models.Target.mission_id == self.model.id)
+            .where(*self.get_where_clauses(filters))
+            .group_by(self.model.id)
+        )
+
+        result = await self._session.execute(statement)
+        row = result.first()
+
+        if row is None:
+            raise ObjectNotFoundException(self.model.__name__, filters)
+
+        db_mission, targets_count, completed_targets_count = row
+
+        return schemas.MissionWithTargetCounts(
+            **self._convert(db_mission).model_dump(),
+            targets_count=targets_count,
+            completed_targets_count=completed_targets_count,
+        )
+
+    async def get_mission_version(self, filters: dict[str, Any]) -> tuple[Any, ...]:
+        """
+        Cheap version of a mission with its targets: id, updated_at, the latest target updated_at, the number of
+        targets and of completed targets. Doesn't load the mission itself.
+        """
+        statement = (
+            select(
+                self.model.id,
+                self.model.updated_at,
+                func.max(models.Target.updated_at),
+                func.count(models.Target.id),
+                func.count(models.Target.id).filter(models.Target.complete.is_(True)),
+            )
+            .outerjoin(models.Target, models.Target.mission_id == self.model.id)
+            .where(*self.get_where_clauses(filters))
+            .group_by(self.model.id)
+        )
+
+        result = await self._session.execute(statement)
+        row = result.first()
+
+        if row is None:
+            raise ObjectNotFoundException(self.model.__name__, filters)
+
+        return tuple(row)
+
+    async def get_multi_with_relations(
+        self,
+        include: Iterable[str],
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        **filters: Any,
+    ) -> tuple[list[schemas.MissionWithRelations], int]:
+        """Page of missions with the `include`d relations loaded by one extra query per relation."""
+        db_missions, total_count = await self.get_multi(
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            options=self._relation_options(include),
+            **filters,
+        )
+
+        return self._convert_with_relations(db_missions=db_missions, include=include), total_count
+
+    async def get_many_by_ids_with_relations(
+        self,
+        ids: Sequence[UUID],
+        include: Iterable[str],
+    ) -> tuple[list[schemas.MissionWithRelations], list[UUID]]:
+        db_missions, missing_ids = await self.get_many_by_ids(
+            ids=ids, options=self._relation_options(include), return_scheme=False
+        )
+
+        return self._convert_with_relations(db_missions=db_missions, include=include), missing_ids
+
+    def _relation_options(self, include: Iterable[str]) -> list[Any]:
+        return [selectinload(getattr(self.model, relation)) for relation in include]
+
+    def _convert_with_relations(
+        self,
+        db_missions: Sequence[models.Mission],
+        include: Iterable[str],
+    ) -> list[schemas.MissionWithRelations]:
+        # relations that were not loaded must not be touched, they would be lazy loaded
+        include = set(include)
+        return [
+            schemas.MissionWithRelations.model_validate(
+                {
+                    **{field: getattr(db_mission, field) for field in schemas.Mission.model_fields},
+                    "cat": db_mission.cat if "cat" in include else None,
+                    "targets": db_mission.targets if "targets" in include else None,
+                }
+            )
+            for db_mission in db_missions
+        ]
+
     def _convert_with_targets(self, db_mission: models.Mission) -> schemas.MissionWithTargets:
         return schemas.MissionWithTargets.model_validate(db_mission)
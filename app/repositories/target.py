@@ -1,7 +1,55 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Boolean, String, Uuid, cast, column, false, func, update, values
+
 from app import models, schemas
+from app.infra.tracing import traced
 from app.repositories.base import RepositoryMixin
 
 
+@traced()
 class TargetRepository(RepositoryMixin[models.Target, schemas.Target]):
     model = models.Target
     schema = schemas.Target
+    search_fields = ("name", "country", "notes")
+
+    async def update_mission_targets(self, mission_id: UUID, changes: list[dict[str, Any]]) -> Sequence[models.Target]:
+        """
+        Applies all changes in a single `UPDATE targets ... FROM (VALUES ...)` statement.
+        Each change holds `id`, `notes` and `complete`, where None keeps the current value.
+        Targets outside the mission and notes on completed targets (already or by this change) are skipped,
+        so callers compare the returned targets with the requested ids.
+        """
+        changes_table = values(
+            column("id", Uuid),
+            column("notes", String),
+            column("complete", Boolean),
+            name="changes",
+        ).data([(change["id"], change["notes"], change["complete"]) for change in changes])
+        # a VALUES column holding only NULLs is typed as text, hence the explicit cast
+        completes = func.coalesce(cast(changes_table.c.complete, Boolean), false())
+
+        statement = (
+            update(self.model)
+            .where(
+                self.model.id == changes_table.c.id,
+                self.model.mission_id == mission_id,
+                # complete may be NULL, which IS NOT TRUE treats as incomplete
+                changes_table.c.notes.is_(None) | (self.model.complete.is_not(True) & ~completes),
+            )
+            .values(
+                notes=func.coalesce(changes_table.c.notes, self.model.notes),
+                complete=self.model.complete.is_(True) | completes,
+            )
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self._session.execute(statement)
+        objs = result.scalars().all()
+
+        await self._session.flush()
+
+        return objs
@@ -2,3 +2,5 @@ from app.schemas.pagination import *
 from app.schemas.cat import *
 from app.schemas.target import *
 from app.schemas.mission import *
+from app.schemas.events import *
+from app.schemas.idempotency import *
@@ -1,8 +1,23 @@
+from typing import Any, Literal
+
 from pydantic import Field, BaseModel
 
 from app.core.exceptions import BadRequestException
 from app.schemas.base import IdTimestampMixin
+from app.schemas.pagination import ListByIdsParams
 from app.services.cat_api import cat_api_service
+from app.utils.utils import escape_like
+
+CatOrderBy = Literal[
+    "name",
+    "-name",
+    "breed",
+    "-breed",
+    "years_of_experience",
+    "-years_of_experience",
+    "created_at",
+    "-created_at",
+]
 
 
 class Cat(IdTimestampMixin):
@@ -30,3 +45,36 @@ class CatCreateRequest(BaseModel):
 
 class CatUpdateRequest(BaseModel):
     salary: float = Field(..., ge=0, description="Salary of the cat, >= 0")
+
+
+class CatListParams(ListByIdsParams):
+    name: str | None = Field(None, min_length=1, description="Case-insensitive part of the cat name")
+    breed: list[str] | None = Field(None, description="Breed of the cat, repeat to match any of several breeds")
+    min_years_of_experience: int | None = Field(None, ge=0)
+    max_years_of_experience: int | None = Field(None, ge=0)
+    min_salary: float | None = Field(None, ge=0)
+    max_salary: float | None = Field(None, ge=0)
+    order_by: CatOrderBy | None = Field(None, description="Sort key, prefix with '-' for descending order")
+
+    def to_filters(self) -> dict[str, Any]:
+        filters: dict[str, Any] = {}
+
+        if self.name is not None:
+            filters["name__ilike"] = f"%{escape_like(self.name)}%"
+
+        if self.breed:
+            filters["breed__in"] = self.breed
+
+        if self.min_years_of_experience is not None:
+            filters["years_of_experience__ge"] = self.min_years_of_experience
+
+        if self.max_years_of_experience is not None:
+            filters["years_of_experience__le"] = self.max_years_of_experience
+
+        if self.min_salary is not None:
+            filters["salary__ge"] = self.min_salary
+
+        if self.max_salary is not None:
+            filters["salary__le"] = self.max_salary
+
+        return filters
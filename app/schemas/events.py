@@ -0,0 +1,24 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+MissionChangeType = Literal[
+    "mission_created",
+    "mission_deleted",
+    "mission_completed",
+    "cat_assigned",
+    "target_updated",
+    "targets_updated",
+]
+
+
+class MissionChangeEvent(BaseModel):
+    type: MissionChangeType
+    mission_id: UUID
+    cat_id: UUID | None = None
+    target_ids: list[UUID] | None = Field(None, description="Changed targets, omitted when there are too many")
+
+
+class MissionStreamParams(BaseModel):
+    mission_id: list[UUID] | None = Field(None, description="Only stream changes of these missions")
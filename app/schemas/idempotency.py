@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Any
+
+from app.schemas.base import CreatedAtMixin
+
+
+class IdempotencyRecord(CreatedAtMixin):
+    scope: str
+    key: str
+    request_hash: str
+    status_code: int | None
+    response_body: dict[str, Any] | None
+    expires_at: datetime
+
+    class Config:
+        from_attributes = True
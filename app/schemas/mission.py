@@ -1,9 +1,16 @@
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
+from app.schemas.cat import Cat
+from app.schemas.pagination import ListByIdsParams
 from app.schemas.target import Target, TargetCreateRequest
 from app.schemas.base import IdTimestampMixin
+from app.utils.utils import escape_like
+
+MissionOrderBy = Literal["name", "-name", "complete", "-complete", "created_at", "-created_at"]
+MissionInclude = Literal["cat", "targets"]
 
 
 class Mission(IdTimestampMixin):
@@ -24,5 +31,57 @@ class MissionWithTargets(Mission):
     targets: list[Target]
 
 
+class MissionWithRelations(Mission):
+    cat: Cat | None = Field(None, description="Assigned cat, only when requested with include=cat")
+    targets: list[Target] | None = Field(None, description="Targets, only when requested with include=targets")
+
+
+class MissionWithTargetCounts(Mission):
+    targets_count: int = Field(description="Number of targets of the mission")
+    completed_targets_count: int = Field(description="Number of completed targets of the mission")
+
+
+MissionView = Literal["full", "summary"]
+
+
 class MissionAssignCatRequest(BaseModel):
     cat_id: UUID
+
+
+class MissionListParams(ListByIdsParams):
+    name: str | None = Field(None, min_length=1, description="Case-insensitive part of the mission name")
+    cat_id: UUID | None = Field(None, description="Cat assigned to the mission")
+    assigned: bool | None = Field(None, description="Whether a cat is assigned to the mission")
+    complete: bool | None = None
+    order_by: MissionOrderBy | None = Field(None, description="Sort key, prefix with '-' for descending order")
+    include: list[MissionInclude] = Field(
+        default_factory=list, description="Relations to embed into every mission, comma separated: cat, targets"
+    )
+
+    @field_validator("include", mode="before")
+    @classmethod
+    def split_include(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            value = [value]
+        if isinstance(value, list):
+            return list(
+                dict.fromkeys(item.strip() for items in value for item in str(items).split(",") if item.strip())
+            )
+        return value
+
+    def to_filters(self) -> dict[str, Any]:
+        filters: dict[str, Any] = {}
+
+        if self.name is not None:
+            filters["name__ilike"] = f"%{escape_like(self.name)}%"
+
+        if self.cat_id is not None:
+            filters["cat_id"] = self.cat_id
+
+        if self.assigned is not None:
+            filters["cat_id__is_not" if self.assigned else "cat_id__is"] = None
+
+        if self.complete is not None:
+            filters["complete"] = self.complete
+
+        return filters
@@ -1,11 +1,24 @@
 from typing import TypeVar, Generic, Any
+from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from app.core.constants.base import PAGINATION_PER_PAGE
+from app.core.constants.base import MAX_IDS_PER_REQUEST, MAX_PER_PAGE, PAGINATION_PER_PAGE
+from app.core.exceptions import BadRequestException
 
 
-__all__ = ["PaginatedResponse", "ItemsResponse", "PaginatedResponseWithUnreadCount"]
+__all__ = [
+    "PaginatedResponse",
+    "ItemsResponse",
+    "PaginatedResponseWithUnreadCount",
+    "PaginationParams",
+    "ListByIdsParams",
+    "SearchParams",
+    "SearchResponse",
+    "CursorPaginatedResponse",
+    "CursorPaginationParams",
+    "PaginatedResponseWithMissingIds",
+]
 
 
 M = TypeVar("M")
@@ -31,9 +44,74 @@ class PaginatedResponse(PaginateBase, Generic[M]):
         return values
 
 
+class SearchResponse(PaginatedResponse[M]):
+    count_capped: bool = Field(
+        default=False, description="More items match than `count`; only the first `count` matches are ranked"
+    )
+
+
 class ItemsResponse(BaseModel, Generic[M]):
     items: list[M] = Field(default_factory=list, description="List of items")
 
 
 class PaginatedResponseWithUnreadCount(PaginatedResponse[M]):
     unread_count: int = Field(description="Number of unread notifications")
+
+
+class PaginatedResponseWithMissingIds(PaginatedResponse[M]):
+    missing_ids: list[UUID] = Field(default_factory=list, description="Requested ids that were not found")
+
+
+class PaginationParams(BaseModel):
+    """
+    Query parameters of a paginated list endpoint.
+    Subclasses declare the allowed filters and sort keys; any other query parameter is rejected.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    page: int = Field(1, ge=1, description="Page number")
+    per_page: int = Field(PAGINATION_PER_PAGE, ge=1, le=MAX_PER_PAGE, description="Items per page")
+
+    def to_filters(self) -> dict[str, Any]:
+        """Map the declared filter parameters onto repository filter keys (see `RepositoryMixin.get_where_clauses`)."""
+        return {}
+
+
+class ListByIdsParams(PaginationParams):
+    ids: list[UUID] | None = Field(
+        None,
+        max_length=MAX_IDS_PER_REQUEST,
+        description="Fetch exactly these objects, in the given order; can't be combined with other filters",
+    )
+
+    @model_validator(mode="after")
+    def ids_without_filters(self) -> "ListByIdsParams":
+        if self.ids is not None and self.to_filters():
+            raise BadRequestException("Filtering by ids can't be combined with other filters.")
+        return self
+
+
+class SearchParams(PaginationParams):
+    q: str = Field(..., min_length=3, description="Text fragment to search for, at least 3 characters")
+
+
+class CursorPaginatedResponse(BaseModel, Generic[M]):
+    items: list[M] = Field(default_factory=list, description="List of items")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page, null on the last page")
+
+
+class CursorPaginationParams(BaseModel):
+    """
+    Query parameters of a keyset-paginated list endpoint.
+    Subclasses declare the allowed filters; any other query parameter is rejected.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    cursor: str | None = Field(None, description="Cursor returned by the previous page")
+    per_page: int = Field(PAGINATION_PER_PAGE, ge=1, le=MAX_PER_PAGE, description="Items per page")
+
+    def to_filters(self) -> dict[str, Any]:
+        """Map the declared filter parameters onto repository filter keys (see `RepositoryMixin.get_where_clauses`)."""
+        return {}
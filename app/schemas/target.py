@@ -1,9 +1,11 @@
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 from app.core.exceptions import BadRequestException
 from app.schemas.base import IdTimestampMixin
+from app.schemas.pagination import CursorPaginationParams
 
 
 class TargetBase(BaseModel):
@@ -33,3 +35,43 @@ class TargetUpdateRequest(BaseModel):
         if self.notes is None and self.is_completed is None:
             raise BadRequestException("At least one field (notes or is_completed) must be provided.")
         return self
+
+
+class TargetBatchUpdateItem(TargetUpdateRequest):
+    id: UUID
+
+
+class TargetBatchUpdateRequest(BaseModel):
+    targets: list[TargetBatchUpdateItem] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def unique_targets(self) -> "TargetBatchUpdateRequest":
+        if len({target.id for target in self.targets}) != len(self.targets):
+            raise BadRequestException("Each target can be updated only once per request.")
+        return self
+
+
+class TargetUpdateResult(BaseModel):
+    target: Target
+    mission_complete: bool = Field(description="Whether the mission is complete after the update")
+
+
+class TargetBatchUpdateResult(BaseModel):
+    targets: list[Target]
+    mission_complete: bool = Field(description="Whether the mission is complete after the update")
+
+
+class TargetListParams(CursorPaginationParams):
+    complete: bool | None = None
+    country: str | None = Field(None, min_length=1)
+
+    def to_filters(self) -> dict[str, Any]:
+        filters: dict[str, Any] = {}
+
+        if self.complete is not None:
+            filters["complete"] = self.complete
+
+        if self.country is not None:
+            filters["country"] = self.country
+
+        return filters
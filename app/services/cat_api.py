@@ -3,8 +3,10 @@ import aiohttp
 from loguru import logger
 
 from app.core import settings
+from app.infra.tracing import traced
 
 
+@traced()
 class CatBreedService:
     _instance = None
     _breeds: set[str] = set()
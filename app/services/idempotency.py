@@ -0,0 +1,79 @@
+import asyncio
+import hashlib
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+
+from app.core.constants.base import IDEMPOTENCY_KEY_CLEANUP_INTERVAL_SECONDS, IDEMPOTENCY_KEY_TTL_SECONDS
+from app.core.exceptions import IdempotencyKeyReusedException
+from app.enums.database import DatabasePool
+from app.infra.tracing import traced
+from app.uow.base import ABCUnitOfWork
+from app.uow.sql import SQLUnitOfWork
+
+
+@traced()
+class IdempotencyService:
+    """
+    Ties retries of a create request to its first execution through the Idempotency-Key header.
+    `replay` and `save` must run inside the transaction of the operation itself,
+    so the stored response is committed together with the created objects.
+    """
+
+    @staticmethod
+    async def replay(
+        sql_uow: ABCUnitOfWork,
+        scope: str,
+        key: str,
+        request: BaseModel,
+    ) -> dict[str, Any] | None:
+        """Returns the stored response of an already executed request, or None when the request is new."""
+        request_hash = hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+
+        record = await sql_uow.idempotency.claim(
+            scope=scope,
+            key=key,
+            request_hash=request_hash,
+            expires_at=datetime.now(UTC) + timedelta(seconds=IDEMPOTENCY_KEY_TTL_SECONDS),
+        )
+
+        if record is None:
+            return None
+
+        if record.request_hash != request_hash:
+            raise IdempotencyKeyReusedException(key)
+
+        return record.response_body
+
+    @staticmethod
+    async def save(
+        sql_uow: ABCUnitOfWork,
+        scope: str,
+        key: str,
+        status_code: int,
+        response: BaseModel,
+    ) -> None:
+        await sql_uow.idempotency.save_response(
+            scope=scope,
+            key=key,
+            status_code=status_code,
+            response_body=response.model_dump(mode="json"),
+        )
+
+    @staticmethod
+    async def delete_expired(sql_uow: ABCUnitOfWork) -> None:
+        async with sql_uow:
+            await sql_uow.idempotency.delete_many(filters={"expires_at__lt": datetime.now(UTC)})
+
+
+async def expire_idempotency_keys() -> None:
+    """Background loop deleting expired idempotency keys, started with the application."""
+    while True:
+        try:
+            await IdempotencyService.delete_expired(sql_uow=SQLUnitOfWork(pool=DatabasePool.background))
+        except Exception:
+            logger.exception("Failed to delete expired idempotency keys")
+
+        await asyncio.sleep(IDEMPOTENCY_KEY_CLEANUP_INTERVAL_SECONDS)
@@ -1,52 +1,154 @@
 from typing import Any
 from uuid import UUID
 
+from starlette import status
+
 from app import schemas
-from app.core.exceptions import BadRequestException
+from app.core.exceptions import BadRequestException, ObjectNotFoundException
+from app.infra.tracing import traced
+from app.services.idempotency import IdempotencyService
 from app.uow.base import ABCUnitOfWork
-from app.utils.utils import calc_offset
+from app.utils.single_flight import single_flight
+from app.utils.utils import calc_offset, decode_cursor, encode_cursor
 
 
+@traced()
 class MissionService:
     @staticmethod
+    @single_flight
     async def get_missions(
         sql_uow: ABCUnitOfWork,
-        page: int,
-        per_page: int,
-    ) -> schemas.PaginatedResponse[schemas.Mission]:
+        params: schemas.MissionListParams,
+    ) -> schemas.PaginatedResponseWithMissingIds[schemas.MissionWithRelations]:
+        if params.ids is not None:
+            async with sql_uow:
+                missions, missing_ids = await sql_uow.mission.get_many_by_ids_with_relations(
+                    ids=params.ids, include=params.include
+                )
+
+            return schemas.PaginatedResponseWithMissingIds[schemas.MissionWithRelations](
+                items=missions, count=len(missions), per_page=len(params.ids), missing_ids=missing_ids
+            )
+
         async with sql_uow:
-            missions, total_count = await sql_uow.mission.get_multi(
-                offset=calc_offset(page, per_page), limit=per_page, return_scheme=True
+            # the fast read path doesn't load relations
+            repository = sql_uow.mission if params.include else sql_uow.mission_reader
+            missions, total_count = await repository.get_multi_with_relations(
+                include=params.include,
+                offset=calc_offset(params.page, params.per_page),
+                limit=params.per_page,
+                order_by=params.order_by,
+                **params.to_filters(),
             )
 
-        return schemas.PaginatedResponse[schemas.Mission](items=missions, count=total_count, per_page=per_page)
+        return schemas.PaginatedResponseWithMissingIds[schemas.MissionWithRelations](
+            items=missions, count=total_count, per_page=params.per_page
+        )
+
+    @staticmethod
+    @single_flight
+    async def search_targets(
+        sql_uow: ABCUnitOfWork,
+        params: schemas.SearchParams,
+    ) -> schemas.SearchResponse[schemas.Target]:
+        async with sql_uow:
+            targets, total_count, count_capped = await sql_uow.target.search(
+                query=params.q,
+                offset=calc_offset(params.page, params.per_page),
+                limit=params.per_page,
+                return_scheme=True,
+            )
+
+        return schemas.SearchResponse[schemas.Target](
+            items=targets, count=total_count, per_page=params.per_page, count_capped=count_capped
+        )
 
     @staticmethod
     async def create_mission(
         sql_uow: ABCUnitOfWork,
         data: schemas.MissionCreateRequest,
+        idempotency_key: str | None = None,
     ) -> schemas.Mission:
         async with sql_uow:
+            if idempotency_key:
+                replay = await IdempotencyService.replay(
+                    sql_uow=sql_uow, scope="create_mission", key=idempotency_key, request=data
+                )
+                if replay is not None:
+                    return schemas.Mission.model_validate(replay)
+
             mission = await sql_uow.mission.create(obj_in={"name": data.name, "complete": False}, return_scheme=True)
 
             targets_data = [{**data.model_dump(), "mission_id": mission.id} for data in data.targets]
 
             await sql_uow.target.create_many(obj_in=targets_data)
 
+            await sql_uow.change_feed.publish(schemas.MissionChangeEvent(type="mission_created", mission_id=mission.id))
+
+            if idempotency_key:
+                await IdempotencyService.save(
+                    sql_uow=sql_uow,
+                    scope="create_mission",
+                    key=idempotency_key,
+                    status_code=status.HTTP_201_CREATED,
+                    response=mission,
+                )
+
         return mission
 
     @staticmethod
+    @single_flight
     async def get_mission_by_id(
         sql_uow: ABCUnitOfWork,
         mission_id: UUID,
-    ) -> schemas.MissionWithTargets:
+        view: schemas.MissionView = "full",
+    ) -> schemas.MissionWithTargets | schemas.MissionWithTargetCounts:
         filters = {"id": mission_id}
 
         async with sql_uow:
-            mission = await sql_uow.mission.get_mission_with_targets(filters=filters)
+            mission: schemas.MissionWithTargets | schemas.MissionWithTargetCounts
+            if view == "summary":
+                mission = await sql_uow.mission.get_mission_with_target_counts(filters=filters)
+            else:
+                mission = await sql_uow.mission_reader.get_mission_with_targets(filters=filters)
 
         return mission
 
+    @staticmethod
+    @single_flight
+    async def get_mission_version(
+        sql_uow: ABCUnitOfWork,
+        mission_id: UUID,
+    ) -> tuple[Any, ...]:
+        async with sql_uow:
+            version = await sql_uow.mission.get_mission_version(filters={"id": mission_id})
+
+        return version
+
+    @staticmethod
+    @single_flight
+    async def get_mission_targets(
+        sql_uow: ABCUnitOfWork,
+        mission_id: UUID,
+        params: schemas.TargetListParams,
+    ) -> schemas.CursorPaginatedResponse[schemas.Target]:
+        after = decode_cursor(params.cursor) if params.cursor else None
+
+        async with sql_uow:
+            await sql_uow.mission_reader.get_fields(filters={"id": mission_id}, fields=["id"])
+
+            targets, next_position = await sql_uow.target_reader.get_multi_by_cursor(
+                limit=params.per_page,
+                after=after,
+                return_scheme=True,
+                mission_id=mission_id,
+                **params.to_filters(),
+            )
+
+        next_cursor = encode_cursor(*next_position) if next_position else None
+
+        return schemas.CursorPaginatedResponse[schemas.Target](items=targets, next_cursor=next_cursor)
+
     @staticmethod
     async def delete_mission(
         sql_uow: ABCUnitOfWork,
@@ -62,6 +164,8 @@ class MissionService:
 
             await sql_uow.mission.delete(filters=filters)
 
+            await sql_uow.change_feed.publish(schemas.MissionChangeEvent(type="mission_deleted", mission_id=mission_id))
+
     @staticmethod
     async def assign_cat_to_mission(
         sql_uow: ABCUnitOfWork,
@@ -81,6 +185,10 @@ class MissionService:
                 return_scheme=True,
             )
 
+            await sql_uow.change_feed.publish(
+                schemas.MissionChangeEvent(type="cat_assigned", mission_id=mission_id, cat_id=request.cat_id)
+            )
+
         return updated_mission
 
     @staticmethod
@@ -89,7 +197,13 @@ class MissionService:
         mission_id: UUID,
         target_id: UUID,
         request: schemas.TargetUpdateRequest,
-    ) -> schemas.MissionWithTargets:
+        minimal: bool = False,
+    ) -> schemas.MissionWithTargets | schemas.TargetUpdateResult:
+        """
+        Updates the target and completes the mission once all its targets are complete.
+        With `minimal` only the updated target and the mission completion flag are returned,
+        without reloading the mission.
+        """
         async with sql_uow:
             filters = {"id": target_id, "mission_id": mission_id}
 
@@ -108,7 +222,19 @@ class MissionService:
                 updates["complete"] = True
 
             if updates:
-                await sql_uow.target.update(filters=filters, updates=updates)
+                target = await sql_uow.target.update(filters=filters, updates=updates)
+
+                await sql_uow.change_feed.publish(
+                    schemas.MissionChangeEvent(type="target_updated", mission_id=mission_id, target_ids=[target_id])
+                )
+
+            if minimal:
+                mission_complete = await _complete_mission_if_done(sql_uow=sql_uow, mission_id=mission_id)
+
+                return schemas.TargetUpdateResult(
+                    target=schemas.Target.model_validate(target),
+                    mission_complete=mission_complete,
+                )
 
             mission = await sql_uow.mission.get_mission_with_targets(filters={"id": mission_id})
 
@@ -119,10 +245,79 @@ class MissionService:
                     return_scheme=True,
                 )
 
+                if not mission.complete:
+                    await sql_uow.change_feed.publish(
+                        schemas.MissionChangeEvent(type="mission_completed", mission_id=mission_id)
+                    )
+
                 mission.complete = True
 
         return mission
 
+    @staticmethod
+    async def update_mission_targets(
+        sql_uow: ABCUnitOfWork,
+        mission_id: UUID,
+        request: schemas.TargetBatchUpdateRequest,
+    ) -> schemas.TargetBatchUpdateResult:
+        changes = [
+            {"id": change.id, "notes": change.notes, "complete": True if change.is_completed else None}
+            for change in request.targets
+        ]
+
+        async with sql_uow:
+            await sql_uow.mission.get_fields(filters={"id": mission_id}, fields=["id"])
+
+            targets = await sql_uow.target.update_mission_targets(mission_id=mission_id, changes=changes)
+
+            if len(targets) != len(changes):
+                updated_ids = {target.id for target in targets}
+                rejected_ids = [change["id"] for change in changes if change["id"] not in updated_ids]
+
+                existing_targets = await sql_uow.target.get_multi_without_pagination(
+                    id__in=rejected_ids, mission_id=mission_id
+                )
+                missing_ids = set(rejected_ids) - {target.id for target in existing_targets}
+
+                if missing_ids:
+                    raise ObjectNotFoundException(sql_uow.target.model.__name__, sorted(map(str, missing_ids)))
+
+                raise BadRequestException("Can't update notes for a completed target.")
+
+            await sql_uow.change_feed.publish(
+                schemas.MissionChangeEvent(
+                    type="targets_updated",
+                    mission_id=mission_id,
+                    target_ids=[target.id for target in targets],
+                )
+            )
+
+            mission_complete = await _complete_mission_if_done(sql_uow=sql_uow, mission_id=mission_id)
+
+            result = schemas.TargetBatchUpdateResult(
+                targets=[schemas.Target.model_validate(target) for target in targets],
+                mission_complete=mission_complete,
+            )
+
+        return result
+
+
+async def _complete_mission_if_done(sql_uow: ABCUnitOfWork, mission_id: UUID) -> bool:
+    """Marks the mission complete once none of its targets is left incomplete."""
+    incomplete_targets = await sql_uow.target.count(filters={"mission_id": mission_id, "complete__is_not": True})
+
+    if incomplete_targets:
+        return False
+
+    completed_missions = await sql_uow.mission.update_many_count(
+        filters={"id": mission_id, "complete__is_not": True}, updates={"complete": True}
+    )
+
+    if completed_missions:
+        await sql_uow.change_feed.publish(schemas.MissionChangeEvent(type="mission_completed", mission_id=mission_id))
+
+    return True
+
 
 async def get_mission_service() -> MissionService:
     return MissionService()
@@ -1,37 +1,99 @@
+from typing import Any
 from uuid import UUID
 
+from starlette import status
+
 from app import schemas
+from app.infra.tracing import traced
+from app.services.idempotency import IdempotencyService
 from app.uow.base import ABCUnitOfWork
+from app.utils.single_flight import single_flight
 from app.utils.utils import calc_offset
 
 
+@traced()
 class SpyCatsService:
     @staticmethod
+    @single_flight
     async def get_cats(
         sql_uow: ABCUnitOfWork,
-        page: int,
-        per_page: int,
-    ) -> schemas.PaginatedResponse[schemas.Cat]:
+        params: schemas.CatListParams,
+    ) -> schemas.PaginatedResponseWithMissingIds[schemas.Cat]:
+        if params.ids is not None:
+            async with sql_uow:
+                cats, missing_ids = await sql_uow.cat.get_many_by_ids(ids=params.ids, return_scheme=True)
+
+            return schemas.PaginatedResponseWithMissingIds[schemas.Cat](
+                items=cats, count=len(cats), per_page=len(params.ids), missing_ids=missing_ids
+            )
+
         async with sql_uow:
-            cats, total_count = await sql_uow.cat.get_multi(
-                offset=calc_offset(page, per_page), limit=per_page, return_scheme=True
+            cats, total_count = await sql_uow.cat_reader.get_multi(
+                offset=calc_offset(params.page, params.per_page),
+                limit=params.per_page,
+                order_by=params.order_by,
+                return_scheme=True,
+                **params.to_filters(),
             )
 
-        return schemas.PaginatedResponse[schemas.Cat](items=cats, count=total_count, per_page=per_page)
+        return schemas.PaginatedResponseWithMissingIds[schemas.Cat](
+            items=cats, count=total_count, per_page=params.per_page
+        )
+
+    @staticmethod
+    @single_flight
+    async def search_cats(
+        sql_uow: ABCUnitOfWork,
+        params: schemas.SearchParams,
+    ) -> schemas.SearchResponse[schemas.Cat]:
+        async with sql_uow:
+            cats, total_count, count_capped = await sql_uow.cat.search(
+                query=params.q,
+                offset=calc_offset(params.page, params.per_page),
+                limit=params.per_page,
+                return_scheme=True,
+            )
+
+        return schemas.SearchResponse[schemas.Cat](
+            items=cats, count=total_count, per_page=params.per_page, count_capped=count_capped
+        )
 
     @staticmethod
     async def create_cat(
         sql_uow: ABCUnitOfWork,
         data: schemas.CatCreateRequest,
+        idempotency_key: str | None = None,
     ) -> schemas.Cat:
-        await data.validate_breed()
+        if not idempotency_key:
+            await data.validate_breed()
 
         async with sql_uow:
+            if idempotency_key:
+                replay = await IdempotencyService.replay(
+                    sql_uow=sql_uow, scope="create_cat", key=idempotency_key, request=data
+                )
+                if replay is not None:
+                    return schemas.Cat.model_validate(replay)
+
+                # a retry replays the stored response even while the cat API is failing;
+                # an invalid breed rolls the claim of the key back with the rest
+                await data.validate_breed()
+
             new_cat = await sql_uow.cat.create(obj_in=data.model_dump(exclude_none=True), return_scheme=True)
 
+            if idempotency_key:
+                await IdempotencyService.save(
+                    sql_uow=sql_uow,
+                    scope="create_cat",
+                    key=idempotency_key,
+                    status_code=status.HTTP_201_CREATED,
+                    response=new_cat,
+                )
+
         return new_cat
 
     @staticmethod
+    @single_flight
     async def get_cat_by_id(
         sql_uow: ABCUnitOfWork,
         cat_id: UUID,
@@ -39,10 +101,21 @@ class SpyCatsService:
         filters = {"id": cat_id}
 
         async with sql_uow:
-            cat = await sql_uow.cat.get(filters=filters, return_scheme=True)
+            cat = await sql_uow.cat_reader.get(filters=filters, return_scheme=True)
 
         return cat
 
+    @staticmethod
+    @single_flight
+    async def get_cat_version(
+        sql_uow: ABCUnitOfWork,
+        cat_id: UUID,
+    ) -> tuple[Any, ...]:
+        async with sql_uow:
+            version = await sql_uow.cat.get_fields(filters={"id": cat_id}, fields=["id", "updated_at"])
+
+        return tuple(version.values())
+
     @staticmethod
     async def update_cat(
         sql_uow: ABCUnitOfWork,
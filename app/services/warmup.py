@@ -0,0 +1,65 @@
+import asyncio
+
+from loguru import logger
+
+from app.core import settings
+from app.core.constants.base import PAGINATION_PER_PAGE
+from app.enums.database import DatabasePool
+from app.uow.base import ABCUnitOfWork
+from app.uow.sql import SQLUnitOfWork
+
+
+class WarmupService:
+    @staticmethod
+    async def prime_statements(sql_uow: ABCUnitOfWork) -> None:
+        """
+        Runs the hot read queries once, so that the connection has them prepared
+        and SQLAlchemy has them compiled before the first real request.
+        """
+        cats, _ = await sql_uow.cat.get_multi(limit=PAGINATION_PER_PAGE, return_scheme=True)
+        if cats:
+            await sql_uow.cat.get(filters={"id": cats[0].id}, return_scheme=True)
+
+        missions, _ = await sql_uow.mission.get_multi_with_relations(include=(), limit=PAGINATION_PER_PAGE)
+        if missions:
+            await sql_uow.mission.get_mission_with_targets(filters={"id": missions[0].id})
+
+        if settings.db.FAST_READS:
+            await sql_uow.fast_cat.get_multi(limit=PAGINATION_PER_PAGE)
+            if cats:
+                await sql_uow.fast_cat.get(filters={"id": cats[0].id})
+
+            await sql_uow.fast_mission.get_multi_with_relations(limit=PAGINATION_PER_PAGE)
+            if missions:
+                await sql_uow.fast_mission.get_mission_with_targets(filters={"id": missions[0].id})
+
+
+async def _warm_up_connection(barrier: asyncio.Barrier) -> None:
+    sql_uow = SQLUnitOfWork(pool=DatabasePool.interactive)
+    try:
+        async with sql_uow:
+            await WarmupService.prime_statements(sql_uow=sql_uow)
+            # Keep the connection checked out until every other one is open, so each session gets its own
+            await barrier.wait()
+    except BaseException:
+        await barrier.abort()
+        raise
+
+
+async def warm_up_database() -> None:
+    """Opens `WARMUP_CONNECTIONS` connections of the interactive pool and primes the hot statements on each."""
+    pool_options = settings.db.pool_options(DatabasePool.interactive, workers=settings.worker_processes)
+    connections = min(settings.db.WARMUP_CONNECTIONS, pool_options["pool_size"] + pool_options["max_overflow"])
+    if connections <= 0:
+        return
+
+    barrier = asyncio.Barrier(connections)
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(_warm_up_connection(barrier) for _ in range(connections))),
+            timeout=settings.db.WARMUP_TIMEOUT_SECONDS,
+        )
+    except Exception:
+        logger.exception("Database warmup failed, the pool will fill up on demand")
+    else:
+        logger.info("Database warmup done: {connections} connections primed", connections=connections)
@@ -3,7 +3,11 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import settings
 from app.repositories.cat import CatRepository
+from app.repositories.change_feed import ChangeFeedRepository
+from app.repositories.fast import FastCatRepository, FastMissionRepository, FastTargetRepository
+from app.repositories.idempotency import IdempotencyRepository
 from app.repositories.mission import MissionRepository
 from app.repositories.target import TargetRepository
 
@@ -14,6 +18,12 @@ class ABCUnitOfWork(ABC):
     cat: CatRepository
     target: TargetRepository
     mission: MissionRepository
+    change_feed: ChangeFeedRepository
+    idempotency: IdempotencyRepository
+
+    fast_cat: FastCatRepository
+    fast_target: FastTargetRepository
+    fast_mission: FastMissionRepository
 
     @abstractmethod
     def __init__(self) -> None:
@@ -26,3 +36,18 @@ class ABCUnitOfWork(ABC):
     @abstractmethod
     async def __aexit__(self, *args: Any) -> None:
         raise NotImplementedError
+
+    @property
+    def cat_reader(self) -> CatRepository | FastCatRepository:
+        """Repository serving cat reads: the fast read path with `FAST_READS`, the ORM otherwise."""
+        return self.fast_cat if settings.db.FAST_READS else self.cat
+
+    @property
+    def target_reader(self) -> TargetRepository | FastTargetRepository:
+        """Repository serving target reads, like `cat_reader`."""
+        return self.fast_target if settings.db.FAST_READS else self.target
+
+    @property
+    def mission_reader(self) -> MissionRepository | FastMissionRepository:
+        """Repository serving mission reads, like `cat_reader`."""
+        return self.fast_mission if settings.db.FAST_READS else self.mission
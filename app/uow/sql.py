@@ -1,17 +1,88 @@
+import asyncio
 from typing import Any
 
+from fastapi import HTTPException
 from loguru import logger
+from sqlalchemy import Connection, event, func, select
+from sqlalchemy.orm import Session, SessionTransaction
 
+from app.core import settings
+from app.core.exceptions import BaseHTTPException, DeadlineExceededException, ResourceBusyException
+from app.core.logger import log_sampler
+from app.enums.database import DatabasePool
 from app.infra.database import get_session_maker
+from app.infra.tracing import tracer
 from app.repositories.cat import CatRepository
+from app.repositories.change_feed import ChangeFeedRepository
+from app.repositories.fast import FastCatRepository, FastMissionRepository, FastTargetRepository
+from app.repositories.idempotency import IdempotencyRepository
 from app.repositories.mission import MissionRepository
 from app.repositories.target import TargetRepository
 from app.uow.base import ABCUnitOfWork
+from app.utils.deadline import remaining_seconds
+
+QUERY_CANCELED = "57014"
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_deadline(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+    """
+    Bounds the transaction's statements by what is left of the request deadline, if there is one.
+    This costs a round trip per transaction, skipped when the connection's own statement_timeout
+    (`STATEMENT_TIMEOUT_SECONDS`) already ends them within the deadline.
+    """
+    remaining = remaining_seconds()
+    if remaining is None:
+        return
+    if settings.db.STATEMENT_TIMEOUT_SECONDS and remaining >= settings.db.STATEMENT_TIMEOUT_SECONDS:
+        return
+
+    statement_timeout = max(1, int(remaining * 1000))
+    lock_timeout = max(1, min(statement_timeout, int(settings.admission.LOCK_TIMEOUT_SECONDS * 1000)))
+    connection.execute(
+        select(
+            func.set_config("statement_timeout", f"{statement_timeout}ms", True),
+            func.set_config("lock_timeout", f"{lock_timeout}ms", True),
+        )
+    )
+
+
+def _translate_timeout(exc: BaseException) -> BaseException:
+    """Turns statements cancelled by statement_timeout or lock_timeout into clean 504 and 503 responses."""
+    # raised by SQLAlchemy, or by asyncpg directly on the fast read path
+    sqlstate = getattr(getattr(exc, "orig", None), "sqlstate", None) or getattr(exc, "sqlstate", None)
+    if sqlstate == QUERY_CANCELED:
+        return DeadlineExceededException()
+    if sqlstate == LOCK_NOT_AVAILABLE:
+        return ResourceBusyException(headers={"Retry-After": str(settings.admission.RETRY_AFTER_SECONDS)})
+    return exc
+
+
+def _log_rollback(exc: BaseException) -> None:
+    """
+    Our HTTP exceptions and other client errors are logged where they are raised, and cancellation (a request
+    past its deadline or a client gone away) is expected; the rest is sampled per class.
+    """
+    if isinstance(exc, BaseHTTPException | asyncio.CancelledError) or (
+        isinstance(exc, HTTPException) and exc.status_code < 500
+    ):
+        return
+
+    dropped = log_sampler.acquire(f"rollback:{type(exc).__name__}")
+    if dropped is None:
+        return
+
+    logger.bind(exception_class=type(exc).__name__, dropped=dropped).opt(exception=exc).error(
+        "An error occurred while processing the request. Rolling back. Error: {exc}",
+        exc=exc,
+    )
 
 
 class SQLUnitOfWork(ABCUnitOfWork):
-    def __init__(self) -> None:
-        self.session_maker = get_session_maker()
+    def __init__(self, pool: DatabasePool = DatabasePool.interactive) -> None:
+        self.pool = pool
+        self.session_maker = get_session_maker(pool)
 
     async def __aenter__(self) -> "SQLUnitOfWork":
         self.session = self.session_maker()
@@ -19,22 +90,28 @@ class SQLUnitOfWork(ABCUnitOfWork):
         self.cat = CatRepository(session=self.session)
         self.target = TargetRepository(session=self.session)
         self.mission = MissionRepository(session=self.session)
+        self.change_feed = ChangeFeedRepository(session=self.session)
+        self.idempotency = IdempotencyRepository(session=self.session)
+        self.fast_cat = FastCatRepository(session=self.session)
+        self.fast_target = FastTargetRepository(session=self.session)
+        self.fast_mission = FastMissionRepository(session=self.session)
 
         return self
 
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-        if exc:
-            logger.exception(
-                "An error occurred while processing the request. Rolling back. Error: {exc}",
-                exc=exc,
-            )
-            await self.session.rollback()
-        else:
-            await self.session.commit()
-        await self.session.close()
-        await logger.complete()
-
-        if exc:
+        error = _translate_timeout(exc) if exc else None
+
+        with tracer.span(f"SQLUnitOfWork.{'rollback' if exc else 'commit'}"):
+            if error:
+                _log_rollback(error)
+                await self.session.rollback()
+            else:
+                await self.session.commit()
+            await self.session.close()
+
+        if error is not None:
+            if error is not exc:
+                raise error from exc
             raise exc
 
     async def rollback(self) -> None:
@@ -0,0 +1,35 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+__all__ = ["deadline", "get_deadline", "remaining_seconds"]
+
+# Monotonic time by which the current request has to be done, None when it has no deadline
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """Gives the code run in the block a time budget of `seconds`, or what is left of an enclosing one."""
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        at = min(at, current)
+
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def get_deadline() -> float | None:
+    return _deadline.get()
+
+
+def remaining_seconds() -> float | None:
+    at = _deadline.get()
+    if at is None:
+        return None
+    return max(0.0, at - time.monotonic())
@@ -0,0 +1,63 @@
+import asyncio
+import functools
+import inspect
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, ParamSpec, TypeVar
+
+from pydantic import BaseModel
+
+__all__ = ["SingleFlight", "single_flight"]
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls: while a call for a key is in flight, callers with the same key
+    await its result instead of starting their own.
+    The call is shielded, so a cancelled caller doesn't cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        call = self._calls.get(key)
+
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.shield(call)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return value
+
+
+def single_flight(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """
+    Shares one in-flight call of a service read method between concurrent identical requests.
+    Arguments are compared by value, except `sql_uow`: only the first caller's unit of work is used,
+    so the followers don't take a connection from the pool.
+    A call that started before a concurrent write committed may return data that precedes that write.
+    """
+    group = SingleFlight()
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        bound = signature.bind(*args, **kwargs)
+        # so that omitting a default and passing it explicitly share the call
+        bound.apply_defaults()
+        key = (
+            func.__qualname__,
+            tuple((name, _freeze(value)) for name, value in bound.arguments.items() if name != "sql_uow"),
+        )
+        return await group.do(key, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -1,2 +1,41 @@
+import base64
+import binascii
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import TypeVar
+from uuid import UUID
+
+from app.core.exceptions import BadRequestException
+
+T = TypeVar("T")
+
+
 def calc_offset(page: int, per_page: int) -> int:
     return (page - 1) * per_page
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE/ILIKE wildcards so that the value is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def encode_cursor(created_at: datetime, _id: UUID) -> str:
+    """Encode a keyset position (created_at, id) into an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, _id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestException(f"Invalid cursor: {cursor}")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split an iterable into lists of at most `size` items, consuming it lazily."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk